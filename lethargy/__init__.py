@@ -7,20 +7,63 @@ __all__ = (
     "take_flag",
     "take_args",
     "take_all",
+    "take_pairs",
+    "expand_abbreviations",
     "argv",
+    "argvb",
+    "environ",
+    "config",
+    "caching",
+    # Transformers
+    # ------------
+    "int_array",
+    "float_array",
+    "byte_string",
+    "choices",
+    "memoize",
     # Error handling
     # --------------
     "show_errors",
     "expecting",
+    "collecting",
+    "Constraints",
+    "reject_unknown",
     "fail",
     # Exceptions
     # ----------
     "ArgsError",
     "MissingOption",
+    "AmbiguousOption",
+    "ConflictingOptions",
+    "MissingDependency",
+    "UnknownOption",
     "TransformError",
     "OptionError",
+    "OptionErrors",
 )
 
-from lethargy.errors import ArgsError, MissingOption, OptionError, TransformError
-from lethargy.options import take_flag, take_args, take_all
-from lethargy.util import argv, expecting, fail, show_errors
+from lethargy.abbreviations import expand_abbreviations
+from lethargy.cache import caching
+from lethargy.constraints import Constraints
+from lethargy.defaults import config, environ
+from lethargy.errors import (
+    AmbiguousOption,
+    ArgsError,
+    ConflictingOptions,
+    MissingDependency,
+    MissingOption,
+    OptionError,
+    OptionErrors,
+    TransformError,
+    UnknownOption,
+)
+from lethargy.options import take_flag, take_args, take_all, take_pairs
+from lethargy.strict import reject_unknown
+from lethargy.transformers import (
+    byte_string,
+    choices,
+    float_array,
+    int_array,
+    memoize,
+)
+from lethargy.util import argv, argvb, collecting, expecting, fail, show_errors
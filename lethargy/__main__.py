@@ -0,0 +1,122 @@
+"""Take options for a shell script, in one process, and print them for `eval`.
+
+    python -m lethargy [--json] [--strict] SPEC... -- [ARGS...]
+
+Each SPEC is an option's names separated by `|`, followed by `:N` for an
+option with N arguments or `:*` for a variadic option, like `v|verbose`,
+`o|output:1` or `include:*`. They're taken from ARGS in the order given,
+exactly like the `take_*` functions would.
+
+The values are printed as shell assignments, named after each option's
+longest name (`--dry-run` is `dry_run`), followed by a `set --` that
+replaces the script's arguments with whatever's left over:
+
+    opts=$(python -m lethargy 'v|verbose' 'o|output:1' -- "$@") || exit
+    eval "$opts"
+
+Flags are `1` when given, and options that weren't given are empty. Options
+with more than one value are a quoted list of words that can be split with
+`eval "set -- $include"`. With `--json`, a JSON object with "options" and
+"args" is printed instead. With `--strict`, anything left over that looks
+like an option is an error.
+"""
+import json
+import shlex
+import sys
+
+from lethargy.options import Explicit, Flag, Variadic, take, take_flag
+from lethargy.strict import reject_unknown
+from lethargy.util import collecting, expecting, falsylist, identity, key_from
+from lethargy.util import names_from, show_errors
+
+
+def option_from(spec):
+    """Get an option from a spec like `v|verbose`, `o|output:1` or `include:*`."""
+    names, _, number = spec.partition(":")
+    names = names_from([name for name in names.split("|") if name])
+
+    if not variable(names).isidentifier():
+        raise ValueError(f"Can't use '{spec}' as the name of a shell variable")
+
+    if not number:
+        return Flag(names)
+    if number == "*":
+        return Variadic(names, identity)
+    if not number.isdigit() or int(number) < 1:
+        raise ValueError(f"Expected a number greater than 0 or '*' in '{spec}'")
+    return Explicit(names, int(number), identity, False)
+
+
+def options_from(specs):
+    """Get the options for a list of specs, each assigned to a different variable."""
+    options = [option_from(spec) for spec in specs]
+    seen = set()
+    for option in options:
+        name = variable(option.names)
+        if name in seen:
+            raise ValueError(f"More than one option would be assigned to '{name}'")
+        seen.add(name)
+    return options
+
+
+def variable(names):
+    """Get the name of the variable an option's value is assigned to."""
+    return key_from(max(sorted(names), key=len))
+
+
+def parse(options, args):
+    """Take every option from the arguments, and get a dict of the values."""
+    values = {}
+    for option in options:
+        value = take(option, args)
+        # Missing options with many values are a falsylist of `None`.
+        values[variable(option.names)] = None if isinstance(value, falsylist) else value
+    return values
+
+
+def shell_value(value):
+    """Get a value quoted for a shell assignment."""
+    if value is True:
+        return "1"
+    if not value:
+        return "''"
+    if isinstance(value, str):
+        return shlex.quote(value)
+    return shlex.quote(" ".join(map(shlex.quote, value)))
+
+
+def shell(values, args):
+    """Get the shell code that assigns every value and sets the arguments."""
+    lines = [f"{name}={shell_value(value)}" for name, value in values.items()]
+    lines.append(" ".join(["set --"] + [shlex.quote(arg) for arg in args]))
+    return "\n".join(lines)
+
+
+def main(args):
+    """Print the options in the arguments after `--` for a shell script."""
+    usage = "Usage: python -m lethargy [--json] [--strict] SPEC... -- [ARGS...]"
+
+    with expecting(ValueError, reason=usage):
+        split = args.index("--")
+    own, script_args = args[:split], args[split + 1 :]
+
+    as_json = take_flag("json", args=own)
+    strict = take_flag("strict", args=own)
+
+    with expecting(ValueError):
+        options = options_from(own[1:])
+
+    with show_errors(), collecting():
+        values = parse(options, script_args)
+        if strict:
+            names = set().union(*(option.names for option in options))
+            reject_unknown(args=script_args, names=names)
+
+    if as_json:
+        print(json.dumps({"options": values, "args": script_args}))
+    else:
+        print(shell(values, script_args))
+
+
+if __name__ == "__main__":
+    main(sys.argv.copy())
@@ -0,0 +1,64 @@
+"""Expand unambiguous abbreviations of option names, like '--verb' to '--verbose'."""
+from bisect import bisect_left, bisect_right
+
+from lethargy.errors import AmbiguousOption
+from lethargy.util import argv, defer, names_from
+
+# Sorts after every other character, so `prefix + LAST` is after every
+# string that starts with `prefix`.
+LAST = chr(0x10FFFF)
+
+
+class Abbreviations:
+    """A sorted index of option names to resolve abbreviations against."""
+
+    def __init__(self, options):
+        # Each item is the name(s) of one option, exactly as given to `take_*`.
+        self.owners = {}
+        for owner, name in enumerate(options):
+            for full in names_from(name):
+                self.owners[full] = owner
+        self.sorted = sorted(self.owners)
+
+    def resolve(self, token):
+        """Get the full name that `token` abbreviates, or `token` if there isn't one."""
+        if token in self.owners or not is_abbreviation(token):
+            return token
+
+        start = bisect_left(self.sorted, token)
+        end = bisect_right(self.sorted, token + LAST, start)
+        matches = self.sorted[start:end]
+
+        if len({self.owners[name] for name in matches}) > 1:
+            these = ", ".join(matches)
+            raise AmbiguousOption(f"Option '{token}' is ambiguous ({these})")
+
+        return matches[0] if matches else token
+
+    def expand(self, args):
+        """Replace every abbreviation before `--` in a list of arguments.
+
+        Which arguments are values of options isn't known yet, so a value
+        that looks like an abbreviation is expanded too.
+        """
+        for index, token in enumerate(args):
+            if token == "--":
+                break
+            try:
+                args[index] = self.resolve(token)
+            except AmbiguousOption as error:
+                if not defer(error):
+                    raise
+
+
+def is_abbreviation(token):
+    """Check if a token could be an abbreviated option name."""
+    if not isinstance(token, str) or len(token) < 2 or token[0].isalnum():
+        return False
+    # Lone prefixes like '--' are never abbreviations.
+    return token.strip(token[0]) != ""
+
+
+def expand_abbreviations(options, *, args=argv):
+    """Replace abbreviated option names in a list of arguments with the full names."""
+    Abbreviations(options).expand(args)
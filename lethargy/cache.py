@@ -0,0 +1,172 @@
+"""Keep the transformed values of options on disk, for repeated invocations.
+
+`pickle` and `hashlib` are only imported once something is cached, so
+`import lethargy` stays fast for scripts that never use `caching()`.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from lethargy.util import cache_dir, caches, private_dir
+
+
+class Cache:
+    """Transformed option values, keyed by the script, the option and its arguments.
+
+    The working directory is part of the key too, since transformers often
+    resolve relative paths.
+
+    Transformers that depend on something other than their argument (like the
+    contents of a file) can define `fingerprint(values)`, and whatever it
+    returns becomes part of the key. Use `clear()` to throw everything away.
+
+    Values are read back with `pickle`, so `path` must be somewhere only you
+    can write to. It's created private to the user, and nothing is cached if
+    an existing directory isn't.
+    """
+
+    def __init__(self, path=None, *, ttl=3600, max_entries=1024, script=None):
+        self.path = path or os.path.join(cache_dir(), "results")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.script = script_stamp(script or sys.argv[0])
+        self.private = None
+
+    def key(self, option, values):
+        """Get the file name that the option's transformed `values` are kept in."""
+        transformer = getattr(option, "transformer", None)
+        fingerprint = getattr(transformer, "fingerprint", None)
+        parts = (
+            self.script,
+            os.getcwd(),
+            type(option).__qualname__,
+            sorted(map(str, option.names)),
+            getattr(option, "number", None),
+            identify(transformer),
+            list(values),
+            fingerprint(values) if fingerprint else None,
+        )
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+        import pickle
+
+        digest = hashlib.sha256(pickle.dumps(parts, protocol=4)).hexdigest()
+        return os.path.join(self.path, f"{digest}.pickle")
+
+    def found(self, option, args):
+        """Get `option.found(args)`, from the cache if it's there and fresh."""
+        # Without a transformer, there's nothing worth caching.
+        if getattr(option, "transformer", None) is None or not self.ready():
+            return option.found(args)
+
+        key = self.key(option, args[1:])
+        import pickle  # pylint: disable=import-outside-toplevel
+
+        try:
+            if time.time() - os.stat(key).st_mtime < self.ttl:
+                with open(key, "rb") as f:
+                    return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+        taken = option.found(args)
+
+        # Anything that can't be cached is just transformed again next time.
+        try:
+            data = pickle.dumps(taken, protocol=4)
+            temporary = f"{key}.{os.getpid()}"
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            with open(os.open(temporary, flags, 0o600), "wb") as f:
+                f.write(data)
+            os.replace(temporary, key)
+            self.evict()
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+        return taken
+
+    def ready(self):
+        """Make `self.path` private to the user (or check it is), only once."""
+        if self.private is None:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                private_dir(self.path)
+                self.private = True
+            except OSError:
+                self.private = False
+        return self.private
+
+    def entries(self):
+        """Get the paths of every cached value."""
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return []
+        return [os.path.join(self.path, n) for n in names if n.endswith(".pickle")]
+
+    def evict(self):
+        """Remove the oldest values until there are at most `self.max_entries`."""
+        entries = self.entries()
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=mtime)
+        for path in entries[: len(entries) - self.max_entries]:
+            remove(path)
+
+    def clear(self):
+        """Remove every cached value."""
+        for path in self.entries():
+            remove(path)
+
+
+def script_stamp(script):
+    """Get something that changes whenever the script is modified."""
+    path = os.path.abspath(script)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path,)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def identify(transformer):
+    """Get a stable identity for a transformer, even if it can't be pickled."""
+    import pickle  # pylint: disable=import-outside-toplevel
+
+    try:
+        return pickle.dumps(transformer, protocol=4)
+    except Exception:  # pylint: disable=broad-except
+        code = getattr(transformer, "__code__", None)
+        return (
+            getattr(transformer, "__module__", None),
+            getattr(transformer, "__qualname__", type(transformer).__qualname__),
+            code.co_firstlineno if code else None,
+        )
+
+
+def mtime(path):
+    """Get the modification time of a file, or 0 if it's gone."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+def remove(path):
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+@contextmanager
+def caching(path=None, *, ttl=3600, max_entries=1024, script=None):
+    """Use a `Cache` for every option taken inside the block."""
+    cache = Cache(path, ttl=ttl, max_entries=max_entries, script=script)
+    caches.append(cache)
+    try:
+        yield cache
+    finally:
+        caches.pop()
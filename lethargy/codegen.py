@@ -0,0 +1,279 @@
+"""Generate a specialised parser module for a fixed list of options.
+
+    python -m lethargy.codegen MODULE:NAME > parser.py
+    python -m lethargy.codegen MODULE:NAME --check [ARGS...]
+
+`MODULE:NAME` is a list of option objects (`Flag`, `Explicit`, `Variadic`)
+in the order they're taken. The generated module has a `parse(args)`
+function that takes every option from `args` in that order, with the
+names, argument counts, messages and transformers written straight into
+the code. It returns a tuple of the values and leaves `args` exactly like
+the `take_*` calls would, raising the same errors with the same messages.
+
+Transformers are imported by name, so they must be importable: lambdas and
+functions defined in a script can't be used. Neither can `defaults`, nor
+`collecting()` or `caching()` blocks.
+"""
+import builtins
+import importlib
+import os
+import sys
+
+from lethargy.options import Explicit, Flag, Variadic, take
+from lethargy.util import expecting, fail, identity
+
+HEADER = '''"""Generated by lethargy.codegen, don't edit by hand."""
+from lethargy.errors import ArgsError, MissingOption, TransformError
+from lethargy.util import falsylist
+'''
+
+PARSE_DOCSTRING = "Take every option from `args`, get a tuple of the values."
+
+HELPERS = """
+
+def _invalid(exc, option, value):
+    message = f"Option '{option}' received an invalid value: {value!r}"
+    return TransformError.of(exc)(message)
+
+
+def _transform_all(transformer, values, option):
+    try:
+        return transformer.all(values)
+    except Exception as exc:
+        for value in values:
+            try:
+                transformer(value)
+            except Exception as inner:
+                raise _invalid(inner, option, value) from inner
+        message = f"Option '{option}' received invalid values: {values!r}"
+        raise TransformError.of(exc)(message) from exc
+"""
+
+
+def reference(transformer):
+    """Get a `(module, name)` pair that the transformer can be imported with."""
+    # Methods of built-in types (like `str.upper`) only know their class.
+    owner = getattr(transformer, "__objclass__", None)
+    module = getattr(transformer, "__module__", getattr(owner, "__module__", None))
+    name = getattr(transformer, "__qualname__", None)
+
+    # Instances (like `lethargy.int_array`) don't have names of their own,
+    # so look for them in the module that defines their type.
+    if name is None:
+        module = type(transformer).__module__
+        namespace = vars(sys.modules.get(module, builtins))
+        names = [k for k, v in namespace.items() if v is transformer]
+        name = names[0] if names else None
+
+    if module is None or name is None or module == "__main__" or "<" in name:
+        raise ValueError(f"Can't import transformer {transformer!r} by name")
+
+    found = importlib.import_module(module)
+    for part in name.split("."):
+        found = getattr(found, part, None)
+    if found is not transformer:
+        raise ValueError(f"Can't import transformer {transformer!r} by name")
+
+    return module, name
+
+
+class Generator:
+    """Accumulates the source code of a parser module."""
+
+    def __init__(self):
+        self.imports = {}
+        self.constants = []
+        self.body = []
+
+    def transformer(self, transformer):
+        """Get the name a transformer is available as, importing it if needed."""
+        module, name = reference(transformer)
+        if module == "builtins":
+            return name
+        if (module, name) not in self.imports:
+            self.imports[module, name] = f"_T{len(self.imports)}"
+        return self.imports[module, name]
+
+    def constant(self, code):
+        """Get the name of a module-level constant, given the code for its value."""
+        self.constants.append(code)
+        return f"_C{len(self.constants) - 1}"
+
+    def emit(self, indent, *lines):
+        """Add lines of code to the body of `parse`."""
+        self.body.extend("    " * indent + line for line in lines)
+
+    def option(self, index, option):
+        """Add the code to take an option from `args`."""
+        if getattr(option, "defaults", None):
+            raise ValueError(f"Can't generate code for defaults of '{option}'")
+
+        # Bytes arguments need the encoded names, like `Named.index_in`.
+        names = sorted(map(repr, option.names))
+        names += sorted(repr(os.fsencode(name)) for name in option.names)
+        names = self.constant("frozenset({" + ", ".join(names) + "})")
+        label = self.constant(repr(str(option)))
+        result = f"v{index}"
+
+        self.emit(1, f"# {option}", "for i, item in enumerate(args):")
+        self.emit(2, f"if item in {names}:")
+
+        if isinstance(option, Flag):
+            self.emit(3, f"{result} = True", "del args[i]", "break")
+            self.emit(1, "else:")
+            self.emit(2, f"{result} = False")
+
+        elif isinstance(option, Variadic):
+            self.values(3, option, result, "args[i + 1 :]", None, label)
+            self.emit(3, "del args[i:]", "break")
+            self.emit(1, "else:")
+            self.emit(2, f"{result} = []")
+
+        elif isinstance(option, Explicit):
+            self.explicit(option, result, label)
+
+        else:
+            raise TypeError(f"Can't generate code for {type(option).__name__}")
+
+        self.emit(0, "")
+
+    def explicit(self, option, result, label):
+        """Add the code to take an `Explicit` option, once it's found."""
+        number = option.number
+        s = "s" if number != 1 else ""
+        prefix = f"Expected {number} argument{s} for option '{option}', but found "
+
+        self.emit(3, f"if len(args) < i + {number + 1}:")
+        self.emit(4, "found = len(args) - 1 - i")
+        prefix = self.constant(repr(prefix))
+        self.emit(4, f"msg = {prefix} + str(found or 'none')")
+        self.emit(4, "if found:")
+        self.emit(5, "msg += ' (' + ', '.join(map(repr, args[i + 1 :])) + ')'")
+        self.emit(4, "raise ArgsError(msg)")
+
+        values = f"args[i + 1 : i + {number + 1}]"
+        self.values(3, option, result, values, number, label)
+        self.emit(3, f"del args[i : i + {number + 1}]", "break")
+        self.emit(1, "else:")
+
+        if option.required:
+            missing = self.constant(repr(f"Missing required option '{option}'"))
+            self.emit(2, f"raise MissingOption({missing})")
+        elif number == 1:
+            self.emit(2, f"{result} = None")
+        else:
+            self.emit(2, f"{result} = falsylist([None] * {number})")
+
+    def values(self, indent, option, result, values, number, label):
+        """Add the code to transform the values of an option."""
+        transformer = option.transformer
+
+        if transformer is identity:
+            self.emit(indent, f"{result} = {'args[i + 1]' if number == 1 else values}")
+            return
+
+        name = self.transformer(transformer)
+
+        if number != 1 and hasattr(transformer, "all"):
+            self.emit(indent, f"{result} = _transform_all({name}, {values}, {label})")
+            return
+
+        if number is None:
+            self.emit(indent, f"{result} = []", f"for value in {values}:")
+            self.emit(indent + 1, "try:")
+            self.emit(indent + 2, f"{result}.append({name}(value))")
+            self.emit(indent + 1, "except Exception as exc:")
+            self.emit(indent + 2, f"raise _invalid(exc, {label}, value) from exc")
+            return
+
+        # Unrolled, so there's one call per value and nothing else.
+        self.emit(indent, "try:")
+        for offset in range(1, number + 1):
+            self.emit(indent + 1, f"value = args[i + {offset}]")
+            self.emit(indent + 1, f"a{offset} = {name}(value)")
+        self.emit(indent, "except Exception as exc:")
+        self.emit(indent + 1, f"raise _invalid(exc, {label}, value) from exc")
+
+        if number == 1:
+            self.emit(indent, f"{result} = a1")
+        else:
+            items = ", ".join(f"a{offset}" for offset in range(1, number + 1))
+            self.emit(indent, f"{result} = [{items}]")
+
+    def source(self, count):
+        """Get the source code of the whole module."""
+        lines = [HEADER]
+        for (module, name), alias in self.imports.items():
+            lines.append(f"from {module} import {name} as {alias}\n")
+        lines.append("\n")
+        lines.extend(f"_C{i} = {code}\n" for i, code in enumerate(self.constants))
+        lines.append(HELPERS)
+        lines.append("\n\ndef parse(args):\n")
+        lines.append(f'    """{PARSE_DOCSTRING}"""\n')
+        lines.extend(f"{line}\n" if line else "\n" for line in self.body)
+        results = ", ".join(f"v{i}" for i in range(count))
+        lines.append(f"    return ({results}{',' if count == 1 else ''})\n")
+        return "".join(lines)
+
+
+def generate(options):
+    """Get the source code of a module with a `parse` function for the options."""
+    generator = Generator()
+    options = list(options)
+    for index, option in enumerate(options):
+        generator.option(index, option)
+    return generator.source(len(options))
+
+
+def load(source, name="lethargy_generated"):
+    """Execute generated source code and get the `parse` function it defines."""
+    namespace = {"__name__": name}
+    exec(compile(source, f"<{name}>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace["parse"]
+
+
+def outcome(function, args):
+    """Get what a parse did: its result or error, and what's left in `args`."""
+    args = list(args)
+    try:
+        result = ("returned", function(args))
+    except Exception as exc:  # pylint: disable=broad-except
+        result = ("raised", type(exc).__name__, str(exc))
+    return result, args
+
+
+def check(options, parse, args):
+    """Check the generated `parse` against the `take_*` logic, get any differences."""
+    options = list(options)
+    expected = outcome(lambda a: tuple(take(o, a) for o in options), args)
+    actual = outcome(parse, args)
+    if expected == actual:
+        return None
+    return f"Expected {expected!r}, but generated parser gave {actual!r}"
+
+
+def main(args):
+    """Print the generated module, or check it against some arguments."""
+    usage = "Usage: python -m lethargy.codegen MODULE:NAME [--check ARGS...]"
+
+    with expecting(IndexError, ValueError, reason=usage):
+        module, name = args[1].split(":")
+
+    with expecting(ImportError, AttributeError):
+        options = getattr(importlib.import_module(module), name)
+
+    with expecting(ValueError, TypeError):
+        source = generate(options)
+
+    if args[2:3] != ["--check"]:
+        print(source, end="")
+        return
+
+    difference = check(options, load(source), args[3:])
+    if difference:
+        fail(difference)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main(sys.argv.copy())
@@ -0,0 +1,213 @@
+"""Generate static shell completion scripts from the options a script takes.
+
+    python -m lethargy.completion bash|zsh|fish|json SCRIPT [--prog NAME]
+
+The script is never run. Its source is scanned for `take_flag`, `take_args`,
+`take_all` and `take_pairs` calls with literal names, so completing doesn't
+have to start Python at all. The scanned options are cached as a JSON spec
+that's only replaced when the script's mtime or size changes.
+"""
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+
+from lethargy.options import Explicit, Flag, Pattern, Variadic, take_args
+from lethargy.util import cache_dir, expecting, identity, names_from, show_errors
+
+# Parameters of each `take_*` function that are needed to describe the option.
+TAKES = {
+    "take_flag": ("name",),
+    "take_args": ("name", "number"),
+    "take_all": ("name",),
+    "take_pairs": ("name",),
+}
+
+
+def declarations(source):
+    """Get the options declared with literal names by `take_*` calls in source code."""
+    found = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.Call):
+            continue
+
+        func = node.func
+        kind = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        if kind not in TAKES:
+            continue
+
+        params = dict(zip(TAKES[kind], node.args))
+        params.update((k.arg, k.value) for k in node.keywords if k.arg in TAKES[kind])
+        try:
+            values = {param: ast.literal_eval(node) for param, node in params.items()}
+            names = names_from(values["name"])
+        except (KeyError, ValueError, TypeError):
+            continue
+
+        if kind == "take_flag":
+            option = Flag(names)
+        elif kind == "take_all":
+            option = Variadic(names, identity)
+        elif kind == "take_pairs":
+            option = Pattern(names, identity)
+        elif isinstance(values.get("number"), int) and values["number"] > 0:
+            option = Explicit(names, values["number"], identity, False)
+        else:
+            continue
+
+        found.append((node.lineno, node.col_offset, option))
+
+    # `ast.walk` is breadth-first, but source order is more useful.
+    return [option for *_, option in sorted(found, key=lambda item: item[:2])]
+
+
+def spec(options):
+    """Get a JSON-compatible description of a list of options."""
+    described = []
+    for option in options:
+        if isinstance(option, Flag):
+            kind, number = "flag", 0
+        elif isinstance(option, Variadic):
+            kind, number = "all", None
+        elif isinstance(option, Pattern):
+            kind, number = "pairs", 1
+        else:
+            kind, number = "args", option.number
+        names = sorted(option.names)
+        described.append({"kind": kind, "names": names, "number": number})
+    return described
+
+
+def from_spec(described):
+    """Get the options back from a description made by `spec`."""
+    options = []
+    for item in described:
+        names = set(item["names"])
+        if item["kind"] == "flag":
+            options.append(Flag(names))
+        elif item["kind"] == "all":
+            options.append(Variadic(names, identity))
+        elif item["kind"] == "pairs":
+            options.append(Pattern(names, identity))
+        else:
+            options.append(Explicit(names, item["number"], identity, False))
+    return options
+
+
+def scan(path):
+    """Get the options a script declares, using the cached spec if it's unchanged."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+
+    digest = hashlib.sha1(path.encode()).hexdigest()
+    cached = os.path.join(cache_dir(), f"completion-{digest}.json")
+
+    try:
+        with open(cached, encoding="utf-8") as f:
+            contents = json.load(f)
+        if contents["stamp"] == stamp:
+            return from_spec(contents["options"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path, "rb") as f:
+        options = declarations(f.read())
+
+    # The cache is only an optimisation, so failing to write it is fine.
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        temporary = f"{cached}.{os.getpid()}"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "options": spec(options)}, f)
+        os.replace(temporary, cached)
+    except OSError:
+        pass
+
+    return options
+
+
+def bash(prog, options):
+    """Get a bash completion script for a program."""
+    words = " ".join(o.prettynames().replace("|", " ") for o in options)
+    func = "_lethargy_" + re.sub(r"\W", "_", prog)
+    return (
+        f"{func}() {{\n"
+        f'    local cur="${{COMP_WORDS[COMP_CWORD]}}"\n'
+        f'    if [[ "$cur" == [-+/]* ]]; then\n'
+        f'        COMPREPLY=($(compgen -W "{words}" -- "$cur"))\n'
+        f"    fi\n"
+        f"}}\n"
+        f"complete -o default -F {func} {prog}\n"
+    )
+
+
+def zsh(prog, options):
+    """Get a zsh completion script for a program."""
+    specs = []
+    for option in options:
+        if isinstance(option, Flag):
+            arguments = ""
+        elif isinstance(option, Variadic):
+            arguments = ":*:value:_files"
+        elif isinstance(option, Pattern):
+            arguments = ":key=value: "
+        else:
+            arguments = ":value:_files" * option.number
+        # Pairs can be given many times, which zsh needs to be told about.
+        repeat = "*" if isinstance(option, Pattern) else ""
+        names = option.prettynames().split("|")
+        specs.extend(f"'{repeat}{name}{arguments}'" for name in names)
+    lines = " \\\n    ".join(["_arguments"] + specs + ["'*:file:_files'"])
+    return f"#compdef {prog}\n{lines}\n"
+
+
+def fish(prog, options):
+    """Get a fish completion script for a program."""
+    lines = []
+    for option in options:
+        parts = [f"complete -c {prog}"]
+        for name in option.prettynames().split("|"):
+            if name.startswith("--"):
+                parts.append(f"-l {name[2:]}")
+            elif name.startswith("-") and len(name) == 2:
+                parts.append(f"-s {name[1:]}")
+            elif name.startswith("-"):
+                parts.append(f"-o {name[1:]}")
+        if len(parts) == 1:
+            continue
+        if not isinstance(option, Flag):
+            parts.append("-r")
+        lines.append(" ".join(parts) + "\n")
+    return "".join(lines)
+
+
+SHELLS = {"bash": bash, "zsh": zsh, "fish": fish}
+
+
+def main(args):
+    """Print a completion script (or the JSON spec) for the script in `args`."""
+    usage = "Usage: python -m lethargy.completion SHELL SCRIPT [--prog NAME]"
+
+    with show_errors():
+        prog = take_args("prog", 1, args=args)
+
+    with expecting(ValueError, reason=usage):
+        _, shell, path = args
+        if shell not in SHELLS and shell != "json":
+            raise ValueError(shell)
+
+    with expecting(OSError, SyntaxError):
+        options = scan(path)
+
+    if shell == "json":
+        print(json.dumps(spec(options), indent=2))
+    else:
+        prog = prog or os.path.basename(path)
+        print(SHELLS[shell](prog, options), end="")
+
+
+if __name__ == "__main__":
+    main(sys.argv.copy())
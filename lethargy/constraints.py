@@ -0,0 +1,101 @@
+"""Rules about which options can, can't, or must be used together."""
+from lethargy.errors import ConflictingOptions, MissingDependency, MissingOption
+from lethargy.util import defer, names_from, trackers
+
+
+class Constraints:
+    """Check groups of options after they've been taken, using a bitmask.
+
+    Every option mentioned in a rule gets its own bit, and each option that's
+    taken inside a `with` block sets its bit in `self.present`. When the block
+    ends, each rule only needs a couple of bitwise operations to check.
+    """
+
+    def __init__(self):
+        self.bits = {}
+        self.labels = {}
+        self.present = 0
+        self.rules = []
+
+    def bit(self, name):
+        """Get the bit of an option, given its name(s) like the `take_*` functions."""
+        names = names_from(name)
+        bit = next((self.bits[n] for n in names if n in self.bits), None)
+        if bit is None:
+            bit = 1 << len(self.labels)
+            self.labels[bit] = "|".join(sorted(sorted(names), key=len))
+        for each in names:
+            self.bits.setdefault(each, bit)
+        return bit
+
+    def mask(self, names):
+        """Get the bits of several options combined."""
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+    def describe(self, mask):
+        """Get the names of the options in a mask, like `'-a', '-b'`."""
+        bits = (bit for bit in self.labels if bit & mask)
+        return ", ".join(f"'{self.labels[bit]}'" for bit in bits)
+
+    def exclusive(self, *names):
+        """Only allow one of these options to be used."""
+        self.rules.append((self.check_exclusive, self.mask(names)))
+
+    def requires(self, name, *needed):
+        """Only allow an option to be used if all of the `needed` options are."""
+        self.rules.append((self.check_requires, (self.bit(name), self.mask(needed))))
+
+    def any_of(self, *names):
+        """Require at least one of these options to be used."""
+        self.rules.append((self.check_any_of, self.mask(names)))
+
+    def check_exclusive(self, mask):
+        """Get a `ConflictingOptions` if more than one option in `mask` is present."""
+        used = self.present & mask
+        # Clearing the lowest bit leaves something if more than one is set.
+        if used & (used - 1):
+            these = self.describe(used)
+            return ConflictingOptions(f"Options can't be used together: {these}")
+        return None
+
+    def check_requires(self, masks):
+        """Get a `MissingDependency` if an option is present without what it needs."""
+        bit, needed = masks
+        missing = needed & ~self.present
+        if self.present & bit and missing:
+            these = self.describe(missing)
+            return MissingDependency(f"Option '{self.labels[bit]}' requires {these}")
+        return None
+
+    def check_any_of(self, mask):
+        """Get a `MissingOption` if none of the options in `mask` are present."""
+        if not self.present & mask:
+            return MissingOption(f"Expected at least one of {self.describe(mask)}")
+        return None
+
+    def taken(self, option):
+        """Set the bit of an option that was found."""
+        for name in option.names:
+            self.present |= self.bits.get(name, 0)
+
+    def check(self):
+        """Get an error for every rule that was broken."""
+        errors = (check(masks) for check, masks in self.rules)
+        return [error for error in errors if error]
+
+    def __enter__(self):
+        self.present = 0
+        trackers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        trackers.remove(self)
+        if exc_type is not None:
+            return
+
+        for error in self.check():
+            if not defer(error):
+                raise error
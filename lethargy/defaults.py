@@ -0,0 +1,101 @@
+"""Sources of default values for options that weren't given.
+
+The modules `config` needs are imported when it's called, so scripts that
+don't read config files don't pay for importing them at startup.
+"""
+import os
+
+from lethargy.util import cache_dir, key_from
+
+
+def environ(prefix, env=os.environ):
+    """Get a snapshot of the environment variables that start with `prefix`."""
+    prefix = prefix.upper().rstrip("_") + "_"
+    start = len(prefix)
+    return {k[start:].lower(): v for k, v in env.items() if k.startswith(prefix)}
+
+
+def config(path, section=None, *, cache=True):
+    """Get defaults from a TOML or INI file, skipping parsing if it's unchanged."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (path, section, stat.st_mtime_ns, stat.st_size)
+
+    if not cache:
+        return read_config(path, section)
+
+    # pylint: disable=import-outside-toplevel
+    import hashlib
+    import marshal
+
+    digest = hashlib.sha1(repr(stamp[:2]).encode()).hexdigest()
+    cached = os.path.join(cache_dir(), f"config-{digest}.marshal")
+
+    try:
+        with open(cached, "rb") as f:
+            cached_stamp, values = marshal.load(f)
+        if tuple(cached_stamp) == stamp:
+            return values
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    values = read_config(path, section)
+
+    # The cache is only an optimisation, so failing to write it is fine.
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        temporary = f"{cached}.{os.getpid()}"
+        with open(temporary, "wb") as f:
+            marshal.dump((stamp, values), f)
+        os.replace(temporary, cached)
+    except OSError:
+        pass
+
+    return values
+
+
+def read_config(path, section=None):
+    """Parse a TOML or INI file into a mapping of defaults."""
+    if path.endswith(".toml"):
+        table = read_toml(path)
+        for part in section.split(".") if section else ():
+            table = table.get(part) if isinstance(table, dict) else None
+        if not isinstance(table, dict):
+            raise ValueError(f"'{path}' has no table [{section}]")
+    else:
+        import configparser  # pylint: disable=import-outside-toplevel
+
+        parser = configparser.ConfigParser(interpolation=None)
+        with open(path, encoding="utf-8") as f:
+            parser.read_file(f)
+        if not section:
+            table = parser.defaults()
+        elif parser.has_section(section):
+            table = dict(parser.items(section))
+        else:
+            raise ValueError(f"'{path}' has no section [{section}]")
+
+    values = {}
+    for key, value in table.items():
+        if isinstance(value, dict):
+            continue
+        if isinstance(value, list):
+            value = [str(item) for item in value]
+        else:
+            value = str(value)
+        values[key_from(key)] = value
+    return values
+
+
+def read_toml(path):
+    """Parse a TOML file with `tomllib` (or `tomli` before Python 3.11)."""
+    try:
+        import tomllib  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        try:
+            import tomli as tomllib  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise RuntimeError("Reading TOML needs Python 3.11+ or 'tomli'") from None
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
@@ -1,4 +1,5 @@
 """Lethargy-specific exceptions."""
+from functools import lru_cache
 
 
 class TransformError(Exception):
@@ -6,14 +7,19 @@ class TransformError(Exception):
 
     @classmethod
     def of(cls, exc):
-        """Create a subclass of the original exception and TransformError."""
-        # The exception needs to be a subclass of both the raised exception
-        # and TransformError. This allows manually handling specific
-        # exception types, _and_ automatically handling all exceptions that
-        # get raised during transformation.
-        exc_type = type(exc)
-        name = f"{cls.__name__}[{exc_type.__name__}]"
-        return type(name, (cls, exc_type), {})
+        """Get a subclass of the original exception and TransformError."""
+        return subclass(cls, type(exc))
+
+
+@lru_cache(maxsize=None)
+def subclass(cls, exc_type):
+    """Create a subclass of an exception type and TransformError (or a subclass)."""
+    # The exception needs to be a subclass of both the raised exception
+    # and TransformError. This allows manually handling specific
+    # exception types, _and_ automatically handling all exceptions that
+    # get raised during transformation. It's only created once per type.
+    name = f"{cls.__name__}[{exc_type.__name__}]"
+    return type(name, (cls, exc_type), {})
 
 
 class OptionError(Exception):
@@ -26,3 +32,43 @@ class ArgsError(OptionError):
 
 class MissingOption(OptionError):
     """Expecting an option, but unable to find it."""
+
+
+class AmbiguousOption(OptionError):
+    """An abbreviated option could be more than one option."""
+
+
+class ConflictingOptions(OptionError):
+    """Options that can't be used together were used together."""
+
+
+class MissingDependency(OptionError):
+    """An option was used without another option that it requires."""
+
+
+class UnknownOption(OptionError):
+    """Something that looks like an option wasn't taken by any option."""
+
+
+try:
+    _ExceptionGroup = ExceptionGroup
+except NameError:  # Python < 3.11
+
+    class _ExceptionGroup(Exception):
+        """Minimal stand-in for the built-in ExceptionGroup."""
+
+        def __init__(self, message, exceptions):
+            super().__init__(message, exceptions)
+            self.message = message
+            self.exceptions = tuple(exceptions)
+
+
+class OptionErrors(OptionError, _ExceptionGroup):
+    """Every option error collected during a single parse."""
+
+    def __str__(self):
+        return "\n".join(map(str, self.exceptions))
+
+    def derive(self, excs):
+        """Create a group of the same type (used by `except*` and `split`)."""
+        return OptionErrors(self.message, excs)
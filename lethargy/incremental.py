@@ -0,0 +1,133 @@
+"""Take the same options again and again while the arguments are being edited.
+
+Interactive prompts that validate a command line as it's typed would call
+every `take_*` function on each keystroke. `Incremental` remembers where each
+option was found, so after an edit it only looks at the options (and the
+part of the arguments) that the edit could affect, and values that were
+already transformed are reused.
+"""
+import copy
+from collections import namedtuple
+
+from lethargy.errors import ArgsError, OptionError, TransformError
+from lethargy.transformers import Memoized
+
+# `start` is where the option's name was found in the arguments it was
+# given, `span` is what was taken from them, and `stop` is where an edit
+# can start without changing anything about the option.
+State = namedtuple("State", "start span stop value error")
+
+# Sorts after any index.
+END = float("inf")
+
+
+class Incremental:
+    """Take a fixed list of options, like `take` in a `collecting()` block."""
+
+    def __init__(self, options, maxsize=4096):
+        self.options = []
+        for option in options:
+            if hasattr(option, "transformer"):
+                option = copy.copy(option)
+                option.transformer = Memoized(option.transformer, maxsize)
+            self.options.append(option)
+
+        self.states = [None] * len(self.options)
+        self.args = []
+        self.remaining = []
+        self.errors = []
+
+    def parse(self, args):
+        """Take every option from the arguments, and get a tuple of the values."""
+        self.args = list(args)
+        self.states = [None] * len(self.options)
+        return self.update(0)
+
+    def edit(self, index, removed, inserted=()):
+        """Replace `removed` arguments at `index`, and get the new tuple of values."""
+        self.args[index : index + removed] = inserted
+        return self.update(index)
+
+    def update(self, changed):
+        """Take the options again, knowing nothing before index `changed` changed."""
+        args = list(self.args)
+        for index, option in enumerate(self.options):
+            old = self.states[index]
+            if old and changed >= old.stop:
+                new = old
+            else:
+                new = retake(option, old, args, changed)
+
+            # The arguments before any removed span are the same in the
+            # list the next option gets, everything after may have moved.
+            if new is old:
+                start, end = new.span
+                changed -= end - start
+            elif old is None:
+                changed = 0
+            else:
+                starts = [state.span[0] for state in (old, new) if state.span]
+                changed = min([changed] + starts)
+
+            if new.span:
+                start, end = new.span
+                del args[start:end]
+
+            self.states[index] = new
+
+        self.remaining = args
+        self.errors = [state.error for state in self.states if state.error]
+        return tuple(state.value for state in self.states)
+
+
+def retake(option, old, args, changed):
+    """Take an option again, only searching the arguments that could've changed."""
+    if old is None:
+        offset = 0
+    elif old.start is not None and old.start < changed:
+        # The name is still in the same place, only its values changed.
+        offset = old.start
+    else:
+        # The name wasn't anywhere before the change.
+        offset = changed
+
+    start, span, value, error = attempt(option, args[offset:])
+
+    if start is not None:
+        start += offset
+    if span:
+        end = span[1]
+        span = offset + span[0], len(args) if end is None else offset + end
+        # Variadic options take every argument, so any edit affects them.
+        stop = END if end is None else span[1]
+    else:
+        stop = END
+
+    return State(start, span, stop, value, error)
+
+
+def attempt(option, args):
+    """Get `(start, span, value, error)` like `take` would in `collecting()`."""
+    try:
+        start, end = option.span(args)
+    except IndexError:
+        return (None,) + missing(option, None)
+    except ArgsError as error:
+        # The name was found, but without enough values after it.
+        return (option.index_in(args),) + missing(option, error)
+    except OptionError as error:
+        return (None,) + missing(option, error)
+
+    try:
+        return start, (start, end), option.found(args[start:end]), None
+    except TransformError as error:
+        return start, (start, end), missing(option, None)[1], error
+
+
+def missing(option, error):
+    """Get `(span, value, error)` for an option that wasn't taken."""
+    try:
+        return None, option.missing(), error
+    except (OptionError, TransformError) as exc:
+        # Only an explicit default can fail, so give the value it'd have without one.
+        return None, option.missing(default=False), error or exc
@@ -1,6 +1,8 @@
 """Modular, shared logic to simplify option implementations."""
-from collections.abc import Callable, Collection
+import os
+from collections.abc import Callable, Collection, Mapping
 from lethargy.errors import MissingOption, TransformError
+from lethargy.util import key_from
 
 
 class Named:
@@ -14,8 +16,12 @@ class Named:
 
     def index_in(self, args, exc=None):
         """Get the index of the first occurrence of a name in the arguments."""
+        names = self.names
+        if args and isinstance(args[0], bytes):
+            names = {os.fsencode(name) for name in names}
+
         for index, item in enumerate(args):
-            if item in self.names:
+            if item in names:
                 return index
         raise exc or IndexError(f"None of {self.names!r} in {args!r}")
 
@@ -32,7 +38,7 @@ class Transforming:
         if isinstance(self.transformer, type):
             return self.transformer.__name__.lower()
 
-        return self.default_metavar
+        return getattr(self.transformer, "metavar", self.default_metavar)
 
     def transform(self, value):
         """Get result of `self.transformer(value)`, but fail with TransformError[E]."""
@@ -43,6 +49,23 @@ class Transforming:
             new = TransformError.of(exc)
             raise new(message) from exc
 
+    def transform_all(self, values):
+        """Get a list of transformed values, or `self.transformer.all(values)`."""
+        convert_all = getattr(self.transformer, "all", None)
+        if convert_all is None:
+            return [self.transform(value) for value in values]
+
+        try:
+            return convert_all(values)
+        except Exception as exc:
+            # The bulk conversion can't say which value was bad, so find the
+            # culprit one at a time to get the same error as `transform`.
+            for value in values:
+                self.transform(value)
+            message = f"Option '{self}' received invalid values: {values!r}"
+            new = TransformError.of(exc)
+            raise new(message) from exc
+
 
 class Requirable:
     """[mixin] Add helper methods for options with a `required` attribute."""
@@ -54,3 +77,20 @@ class Requirable:
         if not self.required:
             return None
         return MissingOption(f"Missing required option '{self}'")
+
+
+class Defaulting:
+    """[mixin] Add helper methods for options with a `defaults` attribute."""
+
+    names: Collection
+    defaults: Mapping
+
+    def default(self):
+        """Get the raw value of the longest name in `self.defaults`, or `None`."""
+        if not self.defaults:
+            return None
+        for name in sorted(self.names, key=len, reverse=True):
+            value = self.defaults.get(key_from(name))
+            if value is not None:
+                return value
+        return None
@@ -1,7 +1,10 @@
 """Defines the main API, along with the backing 'option protocol' implementations."""
-from lethargy.errors import ArgsError
-from lethargy.mixins import Named, Requirable, Transforming
-from lethargy.util import argv, falsylist, names_from, identity as itself
+import os
+
+from lethargy.errors import ArgsError, OptionError, TransformError
+from lethargy.mixins import Defaulting, Named, Requirable, Transforming
+from lethargy.util import argv, caches, defer, falsylist, known, names_from, trackers
+from lethargy.util import identity as itself
 
 
 def take_flag(name, *, args=argv, mut=True):
@@ -10,13 +13,15 @@ def take_flag(name, *, args=argv, mut=True):
     return take(option, args, mut=mut)
 
 
-def take_args(name, number, each=itself, *, args=argv, mut=True, required=False):
+def take_args(
+    name, number, each=itself, *, args=argv, mut=True, required=False, defaults=None
+):
     """Take an option and n arguments belonging to it from a list of arguments."""
     if number < 1:
         msg = f"The number of params ({number}) must be greater than 0."
         raise ValueError(msg)
 
-    option = Explicit(names_from(name), number, each, required)
+    option = Explicit(names_from(name), number, each, required, defaults)
     return take(option, args, mut=mut)
 
 
@@ -26,14 +31,63 @@ def take_all(name, each=itself, *, args=argv, mut=True):
     return take(option, args, mut=mut)
 
 
+def take_pairs(name, each=itself, *, args=argv, mut=True):
+    """Take every `key=value` given to an option (like `-Dkey=value`) as a dict."""
+    option = Pattern(names_from(name), each)
+    known.update(option.names)
+    try:
+        kept, pairs = option.scan(args)
+    except OptionError as error:
+        if not defer(error):
+            raise
+        return option.missing()
+
+    if not pairs:
+        return option.missing()
+
+    for tracker in trackers:
+        tracker.taken(option)
+
+    try:
+        taken = option.found(pairs)
+    except TransformError as error:
+        if not defer(error):
+            raise
+        taken = option.missing()
+
+    # Every occurrence is removed at once, instead of one `del` for each.
+    if mut:
+        args[:] = kept
+
+    return taken
+
+
 def take(option, args, *, mut=True):
     """Use an option object to take a range of arguments from a list."""
+    known.update(getattr(option, "names", ()))
     try:
         start, end = option.span(args)
     except IndexError:
-        return option.missing()
+        return missing(option)
+    except OptionError as error:
+        # Inside `collecting()`, report the error later and carry on as if
+        # the option wasn't given at all.
+        if not defer(error):
+            raise
+        return missing(option)
+
+    for tracker in trackers:
+        tracker.taken(option)
 
-    taken = option.found(args[start:end])
+    try:
+        if caches:
+            taken = caches[-1].found(option, args[start:end])
+        else:
+            taken = option.found(args[start:end])
+    except TransformError as error:
+        if not defer(error):
+            raise
+        taken = missing(option)
 
     if mut:
         del args[start:end]
@@ -41,14 +95,26 @@ def take(option, args, *, mut=True):
     return taken
 
 
-class Explicit(Named, Requirable, Transforming):
+def missing(option):
+    """Get `option.missing()`, deferring errors (like from an invalid default)."""
+    try:
+        return option.missing()
+    except (OptionError, TransformError) as error:
+        if not defer(error):
+            raise
+        # Only an explicit default can fail, so give the value it'd have without one.
+        return option.missing(default=False)
+
+
+class Explicit(Named, Requirable, Transforming, Defaulting):
     """An option that takes a defined number of arguments."""
 
-    def __init__(self, names, number, transform, required):
+    def __init__(self, names, number, transform, required, defaults=None):
         self.names = names
         self.number = number
         self.transformer = transform
         self.required = required
+        self.defaults = defaults
 
     def __str__(self):
         meta = self.metavar()
@@ -59,17 +125,44 @@ class Explicit(Named, Requirable, Transforming):
         """Get either single or multiple transformed values based on `self.number`."""
         if self.number == 1:
             return self.transform(args[1])
-        return [self.transform(arg) for arg in args[1:]]
+        return self.transform_all(args[1:])
+
+    def missing(self, default=True):
+        """Get the transformed default, or either one `None` or a falsylist of them."""
+        value = self.default() if default else None
+
+        if value is None:
+            if self.number == 1:
+                return None
+            return falsylist([None] * self.number)
+
+        if isinstance(value, str) and self.number == 1:
+            values = [value]
+        elif isinstance(value, str):
+            # Only defaults with many values need it, so don't slow down startup.
+            import shlex  # pylint: disable=import-outside-toplevel
+
+            values = shlex.split(value)
+        else:
+            try:
+                values = list(value)
+            except TypeError:
+                # A single value that isn't a string, like `{"threads": 4}`.
+                values = [value]
+
+        if len(values) != self.number:
+            some, s = self.number, "s" if self.number != 1 else ""
+            msg = f"Expected {some} argument{s} for option '{self}'"
+            msg += f", but the default has {len(values)} ({value!r})"
+            raise ArgsError(msg)
 
-    def missing(self):
-        """Get either one `None` or an appropriately sized falsylist of `None`s."""
-        if self.number == 1:
-            return None
-        return falsylist([None] * self.number)
+        return self.found([None] + values)
 
     def span(self, args):
         """Get the start and end indices of the option and its arguments."""
-        start = self.index_in(args, exc=self.check_required())
+        # A default satisfies a required option, it's transformed by `missing`.
+        required = self.check_required() if self.default() is None else None
+        start = self.index_in(args, exc=required)
         end = start + self.number + 1
 
         # There can't be fewer items than the number of expected values!
@@ -100,7 +193,7 @@ class Variadic(Named, Transforming):
 
     def found(self, args):
         """Transform each argument found."""
-        return [self.transform(arg) for arg in args[1:]]
+        return self.transform_all(args[1:])
 
     @staticmethod
     def missing():
@@ -135,3 +228,56 @@ class Flag(Named):
         """Get the index of the flag name and next index."""
         index = self.index_in(args)
         return index, index + 1
+
+
+class Pattern(Named, Transforming):
+    """An option that can be given many times, each with a `key=value` pair."""
+
+    def __init__(self, names, transform):
+        self.names = names
+        self.transformer = transform
+
+    def __str__(self):
+        return f"{self.prettynames()} <key>=<{self.metavar()}>"
+
+    def found(self, pairs):
+        """Get a dict of the transformed values, where later keys win."""
+        keys = [key for key, _ in pairs]
+        return dict(zip(keys, self.transform_all([value for _, value in pairs])))
+
+    @staticmethod
+    def missing():
+        """Get an empty dict."""
+        return {}
+
+    def scan(self, args):
+        """Get the arguments that aren't part of the option, and the pairs that are."""
+        names, sep = self.names, "="
+        if args and isinstance(args[0], bytes):
+            names, sep = {os.fsencode(name) for name in names}, b"="
+
+        # Short names can have the pair attached, like `-Dkey=value`.
+        attached = tuple(name for name in names if len(name) == 2)
+
+        kept = []
+        pairs = []
+        items = iter(args)
+        for item in items:
+            if item in names:
+                pair = next(items, None)
+                if pair is None:
+                    msg = f"Expected 1 argument for option '{self}', but found none"
+                    raise ArgsError(msg)
+            elif attached and item.startswith(attached):
+                pair = item[2:]
+            else:
+                kept.append(item)
+                continue
+
+            key, found, value = pair.partition(sep)
+            if not key or not found:
+                msg = f"Option '{self}' expected a key=value pair, but found {pair!r}"
+                raise ArgsError(msg)
+            pairs.append((key, value))
+
+        return kept, pairs
@@ -0,0 +1,104 @@
+"""Describe options as data, to parse arguments in other processes or machines.
+
+A plan is a list of options (`Flag`, `Explicit`, `Variadic`), written as
+JSON-compatible dicts like the ones `lethargy.completion.spec` makes, with
+each transformer written as a reference: either a name given to `register`,
+or `module:name` for anything that can be imported. Plans pickle as that
+description, so sending one to a `ProcessPoolExecutor` worker (or putting
+`plan.described` on a job queue) never pickles a transformer.
+
+Loading a plan resolves its transformers, so each worker should load it
+once and keep it: give it to the pool's `initializer` to store in a global,
+then call `plan.parse(args)` from a module-level function for every
+argument list. Pickling `plan.parse` with each task would load it again
+every time.
+"""
+import importlib
+
+from lethargy.codegen import reference
+from lethargy.completion import from_spec, spec
+from lethargy.options import Explicit, Flag, Variadic, take
+
+# Transformers that plans can refer to by name, like lambdas and instances
+# that can't be imported. Workers must register the same names.
+registry = {}
+
+
+def register(transformer, name=None):
+    """Let plans refer to a transformer by name (its `__name__` if not given)."""
+    name = name or getattr(transformer, "__name__", None)
+    if not name or ":" in name:
+        raise ValueError(f"Can't register {transformer!r} as {name!r}")
+    registry[name] = transformer
+    return transformer
+
+
+def refer(transformer):
+    """Get the reference a plan uses for a transformer."""
+    for name, registered in registry.items():
+        if registered is transformer:
+            return name
+    module, name = reference(transformer)
+    return f"{module}:{name}"
+
+
+def resolve(ref):
+    """Get the transformer that a reference made by `refer` is for."""
+    if ":" not in ref:
+        try:
+            return registry[ref]
+        except KeyError:
+            raise ValueError(f"No transformer is registered as {ref!r}") from None
+
+    module, _, name = ref.partition(":")
+    found = importlib.import_module(module)
+    for part in name.split("."):
+        try:
+            found = getattr(found, part)
+        except AttributeError:
+            raise ValueError(f"Can't import transformer {ref!r}") from None
+    return found
+
+
+def dump(options):
+    """Get a JSON-compatible description of a list of options."""
+    options = list(options)
+    for option in options:
+        if not isinstance(option, (Flag, Explicit, Variadic)):
+            raise TypeError(f"Can't describe {type(option).__name__} in a plan")
+        if getattr(option, "defaults", None):
+            raise ValueError(f"Can't describe the defaults of '{option}' in a plan")
+
+    described = spec(options)
+    for option, item in zip(options, described):
+        if not isinstance(option, Flag):
+            item["transform"] = refer(option.transformer)
+        if isinstance(option, Explicit):
+            item["required"] = option.required
+    return described
+
+
+def load(described):
+    """Get a plan back from a description made by `dump`."""
+    options = from_spec(described)
+    for option, item in zip(options, described):
+        if "transform" in item:
+            option.transformer = resolve(item["transform"])
+        if "required" in item:
+            option.required = item["required"]
+    return Plan(options)
+
+
+class Plan:
+    """A list of options to take from many lists of arguments."""
+
+    def __init__(self, options):
+        self.options = list(options)
+        self.described = dump(self.options)
+
+    def __reduce__(self):
+        return load, (self.described,)
+
+    def parse(self, args):
+        """Take every option from `args` in order, get a tuple of the values."""
+        return tuple(take(option, args) for option in self.options)
@@ -0,0 +1,358 @@
+"""Run a script in a warm, pre-forked server to skip interpreter startup.
+
+    python -m lethargy.server serve SCRIPT [--socket PATH]
+    python -m lethargy.server run SCRIPT [ARGS...]
+    python -m lethargy.server client SCRIPT [--socket PATH] > launcher
+
+The server imports everything the script imports once, then forks for each
+client. The client sends its arguments, environment and working directory,
+along with its stdin, stdout and stderr file descriptors, so the script reads
+and writes the client's streams directly. `lethargy.argv` is replaced by the
+client's arguments, and the exit code is sent back when the script finishes.
+Signals like Ctrl-C sent to the client are passed on to the script. Use
+`LETHARGY_SOCKET` to tell `run` about a socket given to `serve`. Only works
+on systems with Unix domain sockets.
+
+`python -m` imports the `lethargy` package before this module, which `run`
+doesn't need. The fastest client runs this file directly, with `-S`, since it
+only needs the standard library. `client` prints a shell script that does
+exactly that for a script.
+
+Default sockets are kept in a directory only the user can access. Both sides
+also check that the socket (or the process on the other end of it, where the
+system can tell) belongs to the same user, so nobody else can run the script
+or receive the client's environment and streams.
+"""
+# The client only imports what it needs to connect, so it starts as fast as
+# possible: `socket` and `signal` import `enum`, which would double the time
+# it takes, so their C modules are used instead. Everything else is imported
+# by the server when it's needed.
+import _signal
+import _socket
+import marshal
+import os
+import stat
+import struct
+import sys
+
+# Sent before the request: the length of the marshalled payload that follows.
+HEADER = struct.Struct("!I")
+
+# Sent back once the request is received, so the client can relay signals.
+PID = struct.Struct("!i")
+
+# Sent back after the script finishes.
+STATUS = struct.Struct("!i")
+
+STREAMS = (0, 1, 2)
+
+# File descriptors are sent as C ints (`array` would import `collections.abc`).
+FD = struct.Struct("i")
+
+# Signals the client passes on to the script, like Ctrl-C in its terminal.
+FORWARDED = [
+    getattr(_signal, n) for n in ("SIGINT", "SIGTERM", "SIGHUP") if hasattr(_signal, n)
+]
+
+
+def default_socket(script):
+    """Get the socket path used for a script if one isn't given."""
+    name = os.path.basename(script)
+    runtime = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime, f"lethargy-{os.getuid()}", f"{name}.sock")
+
+
+def check_socket(path):
+    """Check that a socket exists and belongs to this user before connecting."""
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"'{path}' isn't a socket owned by this user")
+
+
+def peer_uid(conn):
+    """Get the user ID of the process at the other end, or None if unknown."""
+    if not hasattr(_socket, "SO_PEERCRED"):
+        return None
+    creds = struct.Struct("3i")
+    data = conn.getsockopt(_socket.SOL_SOCKET, _socket.SO_PEERCRED, creds.size)
+    _, uid, _ = creds.unpack(data)
+    return uid
+
+
+def check_peer(conn):
+    """Raise PermissionError if another user is at the other end of a connection."""
+    uid = peer_uid(conn)
+    if uid is not None and uid != os.getuid():
+        raise PermissionError(f"Connected to a process owned by user {uid}")
+
+
+def preload(source):
+    """Import every module that the script imports at the top level."""
+    # pylint: disable=import-outside-toplevel
+    import ast
+    import importlib
+
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass
+
+
+def serve(script, path=None):
+    """Accept clients forever, running the script in a fork for each one."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    import signal
+    import socket
+
+    # Import what each fork needs once, here, instead of in every fork.
+    import traceback
+    import lethargy.util
+
+    script = os.path.abspath(script)
+    with open(script, "rb") as f:
+        source = f.read()
+    preload(source)
+    code = compile(source, script, "exec")
+
+    if not path:
+        path = default_socket(script)
+        lethargy.util.private_dir(os.path.dirname(path))
+    if os.path.exists(path):
+        os.unlink(path)
+
+    # Children are never waited on, so don't leave zombies behind.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        os.chmod(path, 0o600)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            try:
+                check_peer(conn)
+            except PermissionError:
+                conn.close()
+                continue
+            if os.fork() == 0:
+                child(server, conn, script, code)
+            conn.close()
+
+
+def child(server, conn, script, code):
+    """Handle one client in a forked process, which never returns."""
+    # pylint: disable=import-outside-toplevel
+    import signal
+    import traceback
+
+    status = 1
+    try:
+        server.close()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        # Signals relayed by the client should act like they would normally,
+        # even if the server was started somewhere that ignores them.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        status = handle(conn, script, code)
+    except BaseException:  # pylint: disable=broad-except
+        # Don't unwind into `serve`, the parent is still accepting clients.
+        traceback.print_exc()
+    finally:
+        os._exit(status)  # pylint: disable=protected-access
+
+
+def handle(conn, script, code):
+    """Run the script for one client, then send back the exit code."""
+    from lethargy.util import argv, argvb  # pylint: disable=import-outside-toplevel
+
+    request, fds = receive(conn)
+    conn.sendall(PID.pack(os.getpid()))
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for fd, stream in zip(fds, STREAMS):
+        os.dup2(fd, stream)
+        os.close(fd)
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    # `argv` is the default for every `take_*` call, so it's changed in place.
+    sys.argv = request["argv"].copy()
+    argv[:] = request["argv"]
+    argvb[:] = [os.fsencode(arg) for arg in request["argv"]]
+
+    status = execute(code, script)
+
+    with conn:
+        conn.sendall(STATUS.pack(status))
+    return status
+
+
+def execute(code, script):
+    """Run compiled code as `__main__` and get the exit code it would've had."""
+    import traceback  # pylint: disable=import-outside-toplevel
+
+    status = 0
+    namespace = {"__name__": "__main__", "__file__": script}
+    try:
+        exec(code, namespace)  # pylint: disable=exec-used
+    except SystemExit as exc:
+        if exc.code is None:
+            status = 0
+        elif isinstance(exc.code, int):
+            status = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            status = 1
+    except BaseException:  # pylint: disable=broad-except
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return status
+
+
+def receive(conn):
+    """Get a request and the client's file descriptors from a connection."""
+    fds = []
+    size = FD.size * len(STREAMS)
+    data, ancdata, _, _ = conn.recvmsg(HEADER.size, _socket.CMSG_LEN(size))
+    for level, kind, payload in ancdata:
+        if level == _socket.SOL_SOCKET and kind == _socket.SCM_RIGHTS:
+            count = len(payload) // FD.size
+            fds.extend(struct.unpack(f"{count}i", payload[: count * FD.size]))
+
+    (length,) = HEADER.unpack(data)
+    body = receive_exactly(conn, length, "Client disconnected before sending a request")
+    # The peer is checked to be the same user, so this is as safe as JSON.
+    return marshal.loads(body), fds
+
+
+def receive_exactly(conn, size, error):
+    """Get exactly `size` bytes from a connection, or raise ConnectionError."""
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError(error)
+        data += chunk
+    return data
+
+
+def run(path, args, fds=STREAMS):
+    """Run the script in the server listening at `path`, and get its exit code."""
+    request = {"argv": list(args), "cwd": os.getcwd(), "env": dict(os.environ)}
+    body = marshal.dumps(request)
+    fds = struct.pack(f"{len(fds)}i", *fds)
+    rights = [(_socket.SOL_SOCKET, _socket.SCM_RIGHTS, fds)]
+
+    check_socket(path)
+    client = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+        check_peer(client)
+        client.sendmsg([HEADER.pack(len(body))], rights)
+        client.sendall(body)
+
+        lost = "Server disconnected before the script finished"
+        (pid,) = PID.unpack(receive_exactly(client, PID.size, lost))
+        previous = forward_signals(pid)
+        try:
+            (status,) = STATUS.unpack(receive_exactly(client, STATUS.size, lost))
+        finally:
+            for signum, handler in previous.items():
+                if handler is not None:
+                    _signal.signal(signum, handler)
+    finally:
+        client.close()
+
+    return status
+
+
+def forward_signals(pid):
+    """Relay signals sent to this process to `pid`, and get the old handlers."""
+
+    def relay(signum, _):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    previous = {}
+    for signum in FORWARDED:
+        try:
+            previous[signum] = _signal.signal(signum, relay)
+        except ValueError:
+            # Only the main thread can handle signals.
+            break
+    return previous
+
+
+def stop(message):
+    """Like `lethargy.fail`, without importing lethargy."""
+    print(message, file=sys.stderr)
+    sys.exit(1)
+
+
+def launcher(script, path=None):
+    """Get a shell script that runs a script through the fastest client."""
+    import shlex  # pylint: disable=import-outside-toplevel
+
+    words = [sys.executable, "-S", os.path.abspath(__file__), "run"]
+    command = " ".join(map(shlex.quote, words + [os.path.abspath(script)]))
+    env = f"LETHARGY_SOCKET={shlex.quote(path)} " if path else ""
+    return f'#!/bin/sh\n{env}exec {command} "$@"\n'
+
+
+def main(args):
+    """Serve a script, run it in a server, or print a launcher for it."""
+    usage = (
+        "Usage: python -m lethargy.server serve SCRIPT [--socket PATH]\n"
+        "       python -m lethargy.server run SCRIPT [ARGS...]\n"
+        "       python -m lethargy.server client SCRIPT [--socket PATH]"
+    )
+
+    # Running a script is parsed by hand, so the client never imports lethargy.
+    if len(args) < 3 or args[1] not in ("serve", "run", "client"):
+        stop(usage)
+    command, script = args[1], args[2]
+
+    if command == "run":
+        # Everything after the script belongs to the script, so the socket
+        # can only be changed with an environment variable.
+        path = os.environ.get("LETHARGY_SOCKET") or default_socket(script)
+        try:
+            status = run(path, args[2:])
+        except OSError:
+            stop(f"Couldn't connect to a server at '{path}'")
+        sys.exit(status)
+
+    # pylint: disable=import-outside-toplevel
+    from lethargy.options import take_args
+    from lethargy.util import expecting, show_errors
+
+    with show_errors():
+        path = take_args("socket", 1, args=args)
+    with expecting(ValueError, reason=usage):
+        _, _, script = args
+
+    if command == "client":
+        print(launcher(script, path), end="")
+    else:
+        serve(script, path)
+
+
+if __name__ == "__main__":
+    main(sys.argv.copy())
@@ -0,0 +1,109 @@
+"""Reject leftover arguments that look like options, suggesting similar names."""
+import os
+
+from lethargy.errors import UnknownOption
+from lethargy.util import argv, defer, known
+
+
+def distance(a, b):
+    """Get the Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            cost = previous[j - 1] + (x != y)
+            current.append(min(previous[j] + 1, current[j - 1] + 1, cost))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """An index of words that finds the ones within a distance of another word.
+
+    Each child of a node is keyed by its distance from that node, so the
+    triangle inequality rules out every subtree that's too far away without
+    comparing against the words in it.
+    """
+
+    def __init__(self, words=()):
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        """Add a word to the tree."""
+        if self.root is None:
+            self.root = (word, {})
+            return
+
+        node = self.root
+        while True:
+            parent, children = node
+            d = distance(word, parent)
+            if d == 0:
+                return
+            if d not in children:
+                children[d] = (word, {})
+                return
+            node = children[d]
+
+    def search(self, word, tolerance):
+        """Get `(distance, word)` pairs within `tolerance` of a word, closest first."""
+        if self.root is None:
+            return []
+
+        found = []
+        nodes = [self.root]
+        while nodes:
+            parent, children = nodes.pop()
+            d = distance(word, parent)
+            if d <= tolerance:
+                found.append((d, parent))
+            for key, child in children.items():
+                if d - tolerance <= key <= d + tolerance:
+                    nodes.append(child)
+        return sorted(found)
+
+
+def looks_like_option(token):
+    """Check if an argument looks like an option name (and not a negative number)."""
+    if len(token) < 2 or token[0] != "-" or token == "--":
+        return False
+    try:
+        float(token)
+    except ValueError:
+        return True
+    return False
+
+
+def unknown_options(args, names):
+    """Get an `UnknownOption` for every option-like argument before `--`."""
+    tree = None
+    errors = []
+    for token in args:
+        text = os.fsdecode(token) if isinstance(token, bytes) else str(token)
+        # Everything after `--` is positional, even if it starts with a dash.
+        if text == "--":
+            break
+        # Known names are only left over if they were given too many times
+        # or had an error of their own, so they're not unknown.
+        if not looks_like_option(text) or text in names:
+            continue
+
+        # Only build the index if there's something to suggest names for.
+        tree = tree or BKTree(sorted(names))
+        message = f"Unknown option '{text}'"
+        matches = tree.search(text, max(1, len(text) // 3))
+        if matches:
+            message += f" (did you mean '{matches[0][1]}'?)"
+        errors.append(UnknownOption(message))
+    return errors
+
+
+def reject_unknown(*, args=argv, names=None):
+    """Raise `UnknownOption` if any arguments left over look like options."""
+    for error in unknown_options(args, known if names is None else names):
+        if not defer(error):
+            raise error
@@ -0,0 +1,112 @@
+"""Ready-made transformers to use as the `each` argument of options."""
+import os
+from array import array
+from collections import OrderedDict
+from functools import partial
+
+
+class Packed:
+    """Convert all of an option's values in one go, into a compact container.
+
+    A single value is only converted, not packed, so `number=1` gives a scalar
+    (like `5` rather than `b"\\x05"` from `byte_string`).
+    """
+
+    def __init__(self, metavar, container, convert):
+        self.metavar = metavar
+        self.container = container
+        self.convert = convert
+
+    def __call__(self, value):
+        return self.all([value])[0]
+
+    def all(self, values):
+        """Get every value converted and packed into `self.container`."""
+        try:
+            return self.container(map(self.convert, values))
+        except OverflowError as exc:
+            # Too big for the container is just another invalid value.
+            raise ValueError(str(exc)) from exc
+
+
+int_array = Packed("int", partial(array, "q"), int)
+float_array = Packed("float", partial(array, "d"), float)
+byte_string = Packed("byte", bytes, int)
+
+
+class Choices:
+    """Only accept one of a fixed set of values, optionally ignoring case."""
+
+    def __init__(self, values, casefold=False):
+        self.values = tuple(values)
+        self.casefold = casefold
+        # Each key maps back to the value as it was given, so folded input
+        # still converts to the canonical spelling. Only strings have a case.
+        fold = casefold and (lambda v: v.casefold() if isinstance(v, str) else v)
+        self.lookup = {fold(v) if fold else v: v for v in self.values}
+        self.metavar = "|".join(map(str, self.values))
+        self.message = "Expected one of " + ", ".join(map(repr, self.values))
+
+    def __call__(self, value):
+        # Arguments from `lethargy.argvb` are matched against the same values.
+        if isinstance(value, bytes):
+            value = os.fsdecode(value)
+        if self.casefold and isinstance(value, str):
+            value = value.casefold()
+        try:
+            return self.lookup[value]
+        except (KeyError, TypeError):
+            raise ValueError(self.message) from None
+
+
+def choices(*values, casefold=False):
+    """Make a transformer that only accepts the given values."""
+    return Choices(values, casefold)
+
+
+class Memoized:
+    """Remember what a transformer returned (or raised) for the latest values."""
+
+    def __init__(self, transformer, maxsize):
+        self.transformer = transformer
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+
+    def __call__(self, value):
+        try:
+            succeeded, result = self.results[value]
+        except KeyError:
+            try:
+                succeeded, result = True, self.transformer(value)
+            except Exception as exc:  # pylint: disable=broad-except
+                succeeded, result = False, exc
+            self.results[value] = succeeded, result
+            if len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+        except TypeError:
+            # Unhashable values can't be remembered.
+            return self.transformer(value)
+        else:
+            self.results.move_to_end(value)
+
+        if succeeded:
+            return result
+        # Don't let the traceback grow every time it's raised again.
+        raise result.with_traceback(None)
+
+    def __reduce__(self):
+        # Pickle (and so `lethargy.cache.identify`) without the remembered
+        # results, which change every time the transformer is used.
+        return Memoized, (self.transformer, self.maxsize)
+
+    @property
+    def metavar(self):
+        """Get the metavar of the original transformer, like `Transforming.metavar`."""
+        if isinstance(self.transformer, type):
+            return self.transformer.__name__.lower()
+        return self.transformer.metavar
+
+
+def memoize(transformer, maxsize=1024):
+    """Wrap a transformer so it's only called once for each distinct value."""
+    return Memoized(transformer, maxsize)
@@ -1,15 +1,37 @@
 """Functions and values, independent of other modules."""
+import os
+import stat
 import sys
 from contextlib import contextmanager
-from lethargy.errors import OptionError, TransformError
+from lethargy.errors import OptionError, OptionErrors, TransformError
 
 # Lethargy provides its own argv so you don't have to import sys or worry
 # about mutating the original.
 argv = sys.argv.copy()
 
+# The same arguments as bytes, like `os.environb`. Options taken from it
+# give their values as bytes, ready for file APIs without re-encoding.
+argvb = [os.fsencode(arg) for arg in sys.argv]
+
 falsylist = type("falsylist", (list,), {"__bool__": lambda _: False})
 
-identity = lambda a: a  # noqa
+
+def identity(value):
+    """Get the value back unchanged (the default transformer)."""
+    return value
+
+
+# Error lists of the active `collecting()` blocks, innermost last.
+collectors = []
+
+# Result caches of the active `caching()` blocks, innermost last.
+caches = []
+
+# Anything with a `taken(option)` method, told about every option found.
+trackers = []
+
+# The names of every option taken, to suggest names for typos.
+known = set()
 
 
 def names_from(name):
@@ -17,14 +39,14 @@ def names_from(name):
     if not name:
         raise ValueError("Options must have at least one name.")
 
-    names = name if not isinstance(name, str) else [name]
+    names = name if not isinstance(name, (str, bytes)) else [name]
 
     return {try_name(nm) for nm in names}
 
 
 def try_name(text):
     """Try to make a loosely POSIX-style name."""
-    stripped = str(text).strip()
+    stripped = (os.fsdecode(text) if isinstance(text, bytes) else str(text)).strip()
 
     if not stripped:
         raise ValueError("Cannot make an option name from an empty string.")
@@ -39,6 +61,30 @@ def try_name(text):
     return f"-{name}" if len(name) == 1 else f"--{name}"
 
 
+def key_from(name):
+    """Get the key used to look up an option name in a mapping of defaults."""
+    return str(name).lstrip("-/+").replace("-", "_").lower()
+
+
+def cache_dir():
+    """Get the directory lethargy keeps its caches in."""
+    default = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(os.environ.get("XDG_CACHE_HOME") or default, "lethargy")
+
+
+def private_dir(path):
+    """Make a directory only the user can access, or check an existing one is."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"'{path}' isn't a directory owned by this user")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"'{path}' can be accessed by other users")
+
+
 def fail(message=None):
     """Print a message to stderr and exit with code 1."""
     if message:
@@ -57,4 +103,26 @@ def expecting(*errors, reason=None):
 
 def show_errors():
     """Expect errors from options and values, fail with a useful message."""
-    return expect(OptionError, TransformError)
+    return expecting(OptionError, TransformError)
+
+
+@contextmanager
+def collecting():
+    """Defer errors from options, then raise them together as `OptionErrors`."""
+    errors = []
+    collectors.append(errors)
+    try:
+        yield errors
+    finally:
+        collectors.pop()
+
+    if errors:
+        raise OptionErrors(f"Found {len(errors)} problem(s) with options", errors)
+
+
+def defer(error):
+    """Add an error to the innermost `collecting()` block, if there is one."""
+    if not collectors:
+        return False
+    collectors[-1].append(error)
+    return True
@@ -0,0 +1,40 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=protected-access
+# pylint: disable=redefined-outer-name
+
+from lethargy.mixins import Defaulting
+
+
+def test_default_is_none_without_defaults():
+    class Impl(Defaulting):
+        names = ("-x",)
+        defaults = None
+
+    assert Impl().default() is None
+
+
+def test_default_is_none_if_no_name_has_a_default():
+    class Impl(Defaulting):
+        names = ("-x", "--ex")
+        defaults = {"y": "1"}
+
+    assert Impl().default() is None
+
+
+def test_default_prefers_longest_name():
+    class Impl(Defaulting):
+        names = ("-x", "--example")
+        defaults = {"x": "short", "example": "long"}
+
+    assert Impl().default() == "long"
+
+
+def test_default_looks_up_normalized_key():
+    class Impl(Defaulting):
+        names = ("--dry-run",)
+        defaults = {"dry_run": "yes"}
+
+    assert Impl().default() == "yes"
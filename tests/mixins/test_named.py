@@ -48,3 +48,14 @@ def test_index_raises_exc_instead_of_indexerror_if_set():
     # Works with exception instances.
     with pytest.raises(ValueError):
         Impl().index_in([], exc=ValueError("Instance"))
+
+
+def test_index_in_bytes_arguments_matches_encoded_names():
+    class Impl(Named):
+        names = ("-x", "--\udcffsurrogate")
+
+    assert Impl().index_in([b"a", b"-x"]) == 1
+    assert Impl().index_in([b"a", b"--\xffsurrogate"]) == 1
+
+    with pytest.raises(IndexError):
+        Impl().index_in([b"a", b"-y"])
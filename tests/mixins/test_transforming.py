@@ -71,3 +71,64 @@ def test_original_exception_accessible_through_attribute():
         Impl().transform("Not a string!")
     except TransformError as e:
         assert isinstance(e.__cause__, ValueError)
+
+
+def test_metavar_uses_metavar_attribute_of_transformer():
+    class Transformer:
+        metavar = "thing"
+
+    class Impl(Transforming):
+        transformer = Transformer()
+
+    assert Impl().metavar() == "thing"
+
+
+def test_transform_all_transforms_each_value_into_a_list():
+    class Impl(Transforming):
+        transformer = int
+
+    assert Impl().transform_all(["1", "2"]) == [1, 2]
+
+
+def test_transform_all_uses_all_method_of_transformer():
+    class Transformer:
+        def __call__(self, value):
+            raise AssertionError("Shouldn't be called one at a time")
+
+        def all(self, values):
+            return tuple(values)
+
+    class Impl(Transforming):
+        transformer = Transformer()
+
+    assert Impl().transform_all(["1", "2"]) == ("1", "2")
+
+
+def test_transform_all_finds_the_culprit_if_all_fails():
+    class Transformer:
+        def __call__(self, value):
+            return int(value)
+
+        def all(self, values):
+            return [int(value) for value in values]
+
+    class Impl(Transforming):
+        transformer = Transformer()
+
+    with pytest.raises(TransformError, match="'x'"):
+        Impl().transform_all(["1", "x"])
+
+
+def test_transform_all_raises_transformerror_if_no_culprit_is_found():
+    class Transformer:
+        def __call__(self, value):
+            return value
+
+        def all(self, values):
+            raise ValueError
+
+    class Impl(Transforming):
+        transformer = Transformer()
+
+    with pytest.raises(TransformError):
+        Impl().transform_all(["1", "2"])
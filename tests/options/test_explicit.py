@@ -21,6 +21,7 @@ def test_init():
     assert e.number is b
     assert e.transformer is c
     assert e.required is d
+    assert e.defaults is None
 
 
 @parametrize("required", (True, False))
@@ -56,20 +57,12 @@ def test_span_with_fewer_arguments_than_expected_raises_argserror(required):
 
 
 def test_missing_returns_none_if_number_is_1():
-    class FakeExplicit:
-        def __init__(self, number):
-            self.number = number
-
-    assert Ex.missing(FakeExplicit(1)) is None
+    assert Ex("x", 1, identity, False).missing() is None
 
 
 def test_missing_returns_falsy_list_of_none_if_number_is_not_1():
-    class FakeExplicit:
-        def __init__(self, number):
-            self.number = number
-
     length = 5
-    missing = Ex.missing(FakeExplicit(length))
+    missing = Ex("x", length, identity, False).missing()
     assert isinstance(missing, list)
     assert len(missing) == length
     assert not missing
@@ -101,3 +94,30 @@ def test_found_calls_transform_on_arguments(required, number, expected):
 
     Ex((), number, fn, required).found([0, 1, 2, 3])
     assert accumulated == expected
+
+
+def test_missing_transforms_default():
+    e = Ex(["-x", "--ex"], 1, int, False, {"ex": "5"})
+    assert e.missing() == 5
+
+
+def test_missing_splits_default_string_if_number_is_not_1():
+    e = Ex(["-x"], 2, identity, False, {"x": "a 'b c'"})
+    assert e.missing() == ["a", "b c"]
+
+
+def test_missing_uses_default_sequence_as_is():
+    e = Ex(["-x"], 2, int, False, {"x": ["1", "2"]})
+    assert e.missing() == [1, 2]
+
+
+@parametrize("default", ("a b c", ["a"]))
+def test_missing_raises_argserror_if_default_has_wrong_number(default):
+    with pytest.raises(ArgsError):
+        Ex(["-x"], 2, identity, False, {"x": default}).missing()
+
+
+def test_span_with_default_raises_indexerror_if_required_but_not_found():
+    with pytest.raises(IndexError) as info:
+        Ex(["-w"], 1, identity, True, {"w": "1"}).span("xyz")
+    assert not isinstance(info.value, MissingOption)
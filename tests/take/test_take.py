@@ -7,7 +7,9 @@
 
 import pytest
 
+from lethargy.errors import OptionError, OptionErrors, TransformError
 from lethargy.options import take
+from lethargy.util import collecting
 
 parametrize = pytest.mark.parametrize
 
@@ -104,3 +106,36 @@ def test_take_returns_result_of_found(mut):
             return "something completely different"
 
     assert take(Fake(), [], mut=mut) == "something completely different"
+
+
+@parametrize("mut", (True, False))
+def test_optionerror_from_span_is_deferred_while_collecting(mut):
+    class Fake:
+        def span(self, _):
+            raise OptionError("nope")
+
+        def missing(self):
+            return "missing"
+
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            assert take(Fake(), [], mut=mut) == "missing"
+    assert str(info.value) == "nope"
+
+
+def test_transformerror_from_found_is_deferred_and_span_still_taken():
+    class Fake:
+        def span(self, _):
+            return 1, 2
+
+        def found(self, _):
+            raise TransformError("bad")
+
+        def missing(self):
+            return "missing"
+
+    args = [0, 1, 2]
+    with pytest.raises(OptionErrors):
+        with collecting():
+            assert take(Fake(), args) == "missing"
+    assert args == [0, 2]
@@ -47,3 +47,9 @@ def test_no_args_found_is_empty_list(mut):
     args = x("# # a #")
     assert take_all("This shouldn't be found!", args=args, mut=mut) == []
     assert args == x("# # a #")
+
+
+def test_takes_bytes_arguments_without_decoding():
+    args = [b"a", b"-x", b"\xff.txt", b"b.txt"]
+    assert take_all("x", args=args) == [b"\xff.txt", b"b.txt"]
+    assert args == [b"a"]
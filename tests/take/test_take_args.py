@@ -7,7 +7,14 @@
 
 import pytest
 
-from lethargy import take_args, ArgsError, MissingOption
+from lethargy import (
+    take_args,
+    collecting,
+    ArgsError,
+    MissingOption,
+    OptionErrors,
+    TransformError,
+)
 
 x = str.split
 
@@ -151,3 +158,22 @@ def test_required_argument_must_be_present():
     with pytest.raises(MissingOption):
         take_args("x", 1, required=True, args=args, mut=False)
     assert args == x("# # #")
+
+
+def test_collecting_reports_every_bad_option():
+    args = x("# -x a -y")
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            assert take_args("x", 1, int, args=args) is None
+            assert take_args("y", 1, args=args) is None
+            assert take_args("z", 1, required=True, args=args) is None
+    first, second, third = info.value.exceptions
+    assert isinstance(first, TransformError)
+    assert isinstance(second, ArgsError)
+    assert isinstance(third, MissingOption)
+
+
+def test_take_bytes_arguments_without_decoding():
+    args = [b"#", b"--out", b"\xff", b"#"]
+    assert take_args("out", 1, args=args) == b"\xff"
+    assert args == [b"#", b"#"]
@@ -29,3 +29,9 @@ def test_false_if_not_in_args(mut):
     args = x("# #")
     assert take_flag("x", args=args, mut=mut) is False
     assert args == x("# #")
+
+
+def test_true_if_in_bytes_args():
+    args = [b"#", b"-x", b"#"]
+    assert take_flag(b"x", args=args) is True
+    assert args == [b"#", b"#"]
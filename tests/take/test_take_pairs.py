@@ -0,0 +1,97 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=protected-access
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from lethargy import Constraints, take_pairs
+from lethargy.errors import ArgsError, MissingDependency, OptionErrors, TransformError
+from lethargy.util import collecting
+
+x = str.split
+
+
+def test_takes_attached_and_separate_pairs():
+    args = x("a -Dx=1 b --set y=2 -Dz= c")
+    assert take_pairs(["D", "set"], args=args) == {"x": "1", "y": "2", "z": ""}
+    assert args == x("a b c")
+
+
+def test_no_mut_takes_pairs():
+    args = x("a -Dx=1 b")
+    assert take_pairs("D", args=args, mut=False) == {"x": "1"}
+    assert args == x("a -Dx=1 b")
+
+
+def test_later_pairs_win():
+    assert take_pairs("D", args=x("-Dx=1 -Dy=2 -Dx=3")) == {"x": "3", "y": "2"}
+
+
+def test_values_can_contain_equals():
+    assert take_pairs("D", args=x("-Dx=a=b")) == {"x": "a=b"}
+
+
+def test_takes_pairs_and_calls_callable():
+    args = x("-Dx=1 --set y=2")
+    assert take_pairs(["D", "set"], int, args=args) == {"x": 1, "y": 2}
+
+
+def test_long_names_are_never_attached():
+    args = x("--setx=1")
+    assert take_pairs("set", args=args) == {}
+    assert args == x("--setx=1")
+
+
+@pytest.mark.parametrize("mut", (True, False))
+def test_no_pairs_found_is_empty_dict(mut):
+    args = x("# # a #")
+    assert take_pairs("D", args=args, mut=mut) == {}
+    assert args == x("# # a #")
+
+
+@pytest.mark.parametrize("args", ("-Dx", "-D=1", "--set x", "--set"))
+def test_malformed_pair_raises_args_error(args):
+    args = x(args)
+    with pytest.raises(ArgsError):
+        take_pairs(["D", "set"], args=args)
+    assert args == x(" ".join(args))
+
+
+def test_malformed_pair_message():
+    with pytest.raises(ArgsError) as info:
+        take_pairs(["D", "set"], args=x("-Dx"))
+    message = "Option '-D|--set <key>=<value>' expected a key=value pair, but found 'x'"
+    assert str(info.value) == message
+
+
+def test_invalid_value_raises_transform_error():
+    with pytest.raises(TransformError) as info:
+        take_pairs("D", int, args=x("-Dx=1 -Dy=a"))
+    assert str(info.value) == "Option '-D <key>=<int>' received an invalid value: 'a'"
+
+
+def test_errors_are_deferred_while_collecting():
+    args = x("-Dx -Ey=a")
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            assert take_pairs("D", args=args) == {}
+            assert take_pairs("E", int, args=args) == {}
+    assert len(info.value.exceptions) == 2
+
+
+def test_constraints_see_pairs():
+    rules = Constraints()
+    rules.requires("D", "verbose")
+    with pytest.raises(OptionErrors) as info:
+        with collecting(), rules:
+            take_pairs("D", args=x("-Dx=1"))
+    assert [type(e) for e in info.value.exceptions] == [MissingDependency]
+
+
+def test_takes_bytes_arguments_without_decoding():
+    args = [b"a", b"-Dx=\xff", b"--set", b"y=2"]
+    assert take_pairs(["D", "set"], args=args) == {b"x": b"\xff", b"y": b"2"}
+    assert args == [b"a"]
@@ -0,0 +1,69 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import pytest
+
+from lethargy import take_flag, collecting, AmbiguousOption, OptionErrors
+from lethargy.abbreviations import Abbreviations, expand_abbreviations
+
+x = str.split
+
+OPTIONS = [["v", "verbose"], "version", ["color", "colour"], "output"]
+
+
+@pytest.fixture
+def abbreviations():
+    return Abbreviations(OPTIONS)
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("--verb", "--verbose"),
+        ("--versi", "--version"),
+        ("--out", "--output"),
+        ("--output", "--output"),
+        ("-v", "-v"),
+        ("--nothing", "--nothing"),
+        ("value", "value"),
+        ("--", "--"),
+        ("-", "-"),
+    ],
+)
+def test_resolve(abbreviations, token, expected):
+    assert abbreviations.resolve(token) == expected
+
+
+def test_resolve_names_of_the_same_option_are_not_ambiguous(abbreviations):
+    assert abbreviations.resolve("--col") in ("--color", "--colour")
+
+
+@pytest.mark.parametrize("token", ("--ver", "--v"))
+def test_resolve_raises_ambiguousoption(abbreviations, token):
+    with pytest.raises(AmbiguousOption):
+        abbreviations.resolve(token)
+
+
+def test_expand_replaces_abbreviations_in_place():
+    args = x("script --verb --out file.txt")
+    expand_abbreviations(OPTIONS, args=args)
+    assert args == x("script --verbose --output file.txt")
+    assert take_flag("verbose", args=args) is True
+
+
+def test_expand_defers_ambiguity_while_collecting():
+    args = x("script --ver --out x")
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            expand_abbreviations(OPTIONS, args=args)
+    assert isinstance(info.value.exceptions[0], AmbiguousOption)
+    assert args == x("script --ver --output x")
+
+
+def test_expand_stops_at_double_dash():
+    args = x("s --verb -- --verb")
+    expand_abbreviations([["v", "verbose"], "version"], args=args)
+    assert args == x("s --verbose -- --verb")
@@ -0,0 +1,169 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import os
+
+import pytest
+
+from lethargy import take_all, take_args, take_flag, TransformError
+from lethargy.cache import Cache, caching, identify
+from lethargy.options import Variadic
+from lethargy.transformers import memoize
+from lethargy.util import caches
+
+x = str.split
+
+calls = []
+
+
+def counted(value):
+    calls.append(value)
+    return int(value)
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text("print('hi')\n")
+    calls.clear()
+    return str(path)
+
+
+@pytest.fixture
+def location(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_caching_is_only_active_inside_the_block(location, script):
+    with caching(location, script=script) as cache:
+        assert caches == [cache]
+    assert caches == []
+
+
+def test_identical_arguments_are_only_transformed_once(location, script):
+    for _ in range(3):
+        with caching(location, script=script):
+            assert take_all("x", counted, args=x("# -x 1 2 3")) == [1, 2, 3]
+    assert calls == ["1", "2", "3"]
+
+
+def test_different_arguments_are_transformed_again(location, script):
+    with caching(location, script=script):
+        assert take_args("x", 1, counted, args=x("-x 1")) == 1
+        assert take_args("x", 1, counted, args=x("-x 2")) == 2
+    assert calls == ["1", "2"]
+
+
+def test_different_options_are_cached_separately(location, script):
+    with caching(location, script=script):
+        assert take_all("x", counted, args=x("-x 1")) == [1]
+        assert take_all("y", counted, args=x("-y 1")) == [1]
+        assert take_all("x", int, args=x("-x 1")) == [1]
+    assert calls == ["1", "1"]
+
+
+def test_changing_the_script_invalidates_the_cache(location, script):
+    with caching(location, script=script):
+        take_all("x", counted, args=x("-x 1"))
+    with open(script, "a") as f:
+        f.write("print('changed')\n")
+    with caching(location, script=script):
+        take_all("x", counted, args=x("-x 1"))
+    assert calls == ["1", "1"]
+
+
+def test_expired_values_are_transformed_again(location, script):
+    with caching(location, ttl=0, script=script):
+        take_all("x", counted, args=x("-x 1"))
+        take_all("x", counted, args=x("-x 1"))
+    assert calls == ["1", "1"]
+
+
+def test_fingerprint_is_part_of_the_key(location, script):
+    state = {"version": 1}
+
+    class Transformer:
+        def __call__(self, value):
+            calls.append(value)
+            return value
+
+        def fingerprint(self, values):
+            return state["version"]
+
+    with caching(location, script=script):
+        take_all("x", Transformer(), args=x("-x a"))
+        take_all("x", Transformer(), args=x("-x a"))
+        state["version"] = 2
+        take_all("x", Transformer(), args=x("-x a"))
+    assert calls == ["a", "a"]
+
+
+def test_errors_are_not_cached(location, script):
+    with caching(location, script=script) as cache:
+        for _ in range(2):
+            with pytest.raises(TransformError):
+                take_all("x", counted, args=x("-x a"))
+        assert cache.entries() == []
+    assert calls == ["a", "a"]
+
+
+def test_flags_are_not_cached(location, script):
+    with caching(location, script=script) as cache:
+        assert take_flag("x", args=x("-x")) is True
+        assert cache.entries() == []
+
+
+def test_oldest_entries_are_evicted(location, script):
+    with caching(location, max_entries=2, script=script) as cache:
+        for number in range(4):
+            take_all("x", counted, args=["-x", str(number)])
+            path = cache.key(Variadic({"-x"}, counted), [str(number)])
+            os.utime(path, (number, number))
+        assert len(cache.entries()) == 2
+
+
+def test_clear_removes_everything(location, script):
+    cache = Cache(location, script=script)
+    with caching(location, script=script):
+        take_all("x", counted, args=x("-x 1"))
+    assert cache.entries()
+    cache.clear()
+    assert cache.entries() == []
+
+
+def test_memoized_transformers_have_a_stable_identity(location, script):
+    memoized = memoize(counted)
+    before = identify(memoized)
+    for _ in range(2):
+        with caching(location, script=script):
+            assert take_args("x", 1, memoized, args=x("-x 1")) == 1
+            assert take_args("y", 1, memoized, args=x("-y 2")) == 2
+    assert identify(memoized) == before
+    assert calls == ["1", "2"]
+
+
+def test_working_directory_is_part_of_the_key(location, script, tmp_path, monkeypatch):
+    for directory in (tmp_path, tmp_path.parent, tmp_path):
+        monkeypatch.chdir(directory)
+        with caching(location, script=script):
+            assert take_args("x", 1, counted, args=x("-x 1")) == 1
+    assert calls == ["1", "1"]
+
+
+def test_cache_is_private_to_the_user(location, script):
+    with caching(location, script=script) as cache:
+        take_args("n", 1, counted, args=x("-n 1"))
+    assert os.stat(location).st_mode & 0o777 == 0o700
+    assert [os.stat(p).st_mode & 0o777 for p in cache.entries()] == [0o600]
+
+
+def test_shared_cache_directory_is_not_used(location, script):
+    os.mkdir(location)
+    os.chmod(location, 0o777)
+    with caching(location, script=script) as cache:
+        take_args("n", 1, counted, args=x("-n 1"))
+        take_args("n", 1, counted, args=x("-n 1"))
+    assert (calls, cache.entries()) == (["1", "1"], [])
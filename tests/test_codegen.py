@@ -0,0 +1,107 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+from pathlib import Path
+
+import pytest
+
+from lethargy import codegen
+from lethargy.options import Explicit, Flag, Variadic
+from lethargy.transformers import int_array
+from lethargy.util import identity
+
+x = str.split
+
+OPTIONS = [
+    Flag({"-v", "--verbose"}),
+    Explicit({"-n", "--number"}, 1, int, False),
+    Explicit({"--pos"}, 2, float, True),
+    Explicit({"-o"}, 1, identity, False),
+    Explicit({"--name"}, 3, identity, False),
+    Explicit({"--paths"}, 2, Path, False),
+    Explicit({"--pair"}, 2, int_array, False),
+    Variadic({"--ids"}, int_array),
+    Variadic({"--rest"}, str.upper),
+]
+
+ARGS = [
+    "script --pos 1 2",
+    "script -v --pos 1 2 -n 3 rest",
+    "script --pos 1 2 --verbose -v",
+    "script --pos 1 2 -o a --name a b c --paths x y --pair 1 2 --ids 4 5",
+    "script --pos 1 2 --rest a b",
+    "script --pos 1 2 --ids 1 2 --rest a b",
+    "script",
+    "script --pos 1",
+    "script --pos 1 x",
+    "script --pos",
+    "script --pos 1 2 -n",
+    "script --pos 1 2 -n x",
+    "script --pos 1 2 --name a b",
+    "script --pos 1 2 --pair 1 256000000000000000000",
+    "script --pos 1 2 --ids 1 x 3",
+]
+
+
+@pytest.fixture(scope="module")
+def parse():
+    return codegen.load(codegen.generate(OPTIONS))
+
+
+@pytest.mark.parametrize("args", ARGS)
+def test_generated_parser_matches_take(parse, args):
+    assert codegen.check(OPTIONS, parse, x(args)) is None
+
+
+def test_generated_parser_matches_take_with_bytes_arguments(parse):
+    args = [arg.encode() for arg in x("script -v --pos 1 2 -o z")]
+    assert codegen.check(OPTIONS, parse, args) is None
+
+
+def test_generated_parser_mutates_args(parse):
+    args = x("script -v --pos 1 2 -o a rest")
+    values = parse(args)
+    assert values[:4] == (True, None, [1.0, 2.0], "a")
+    assert args == x("script rest")
+
+
+def test_check_reports_differences():
+    def parse(args):
+        del args[:]
+        return (True,)
+
+    difference = codegen.check([Flag({"-v"})], parse, x("script -v"))
+    assert difference.startswith("Expected")
+
+
+def test_generated_source_is_deterministic():
+    assert codegen.generate(OPTIONS) == codegen.generate(OPTIONS)
+
+
+def test_transformers_must_be_importable():
+    def local(value):
+        return value
+
+    for transformer in (local, lambda value: value):
+        with pytest.raises(ValueError):
+            codegen.generate([Variadic({"-x"}, transformer)])
+
+
+def test_defaults_are_rejected():
+    with pytest.raises(ValueError):
+        codegen.generate([Explicit({"-x"}, 1, int, False, {"x": "1"})])
+
+
+def test_main_checks_module_attribute(capsys):
+    codegen.main(["codegen", f"{__name__}:OPTIONS", "--check", "s", "--pos", "1", "2"])
+    out, _ = capsys.readouterr()
+    assert out == "OK\n"
+
+
+def test_main_prints_source(capsys):
+    codegen.main(["codegen", f"{__name__}:OPTIONS"])
+    out, _ = capsys.readouterr()
+    assert "def parse(args):" in out
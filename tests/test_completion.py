@@ -0,0 +1,115 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import json
+
+import pytest
+
+from lethargy import completion
+from lethargy.options import Explicit, Flag, Pattern, Variadic
+
+SCRIPT = """
+import lethargy
+from lethargy import take_all
+verbose = lethargy.take_flag(['v', 'verbose'])
+with lethargy.show_errors():
+    start, end = lethargy.take_args('set hours', number=2) or (9, 5)
+    out = lethargy.take_args(['o', 'output'], 1, required=True)
+    dynamic = lethargy.take_args(NAME, 1)
+ignored = take_all('ignore')
+defines = lethargy.take_pairs(['D', 'define'])
+"""
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "script.py"
+    path.write_text(SCRIPT)
+    return path
+
+
+def test_declarations_finds_literal_options_in_source_order():
+    options = completion.declarations(SCRIPT)
+    assert [type(o) for o in options] == [Flag, Explicit, Explicit, Variadic, Pattern]
+    assert [o.names for o in options] == [
+        {"-v", "--verbose"},
+        {"--set-hours"},
+        {"-o", "--output"},
+        {"--ignore"},
+        {"-D", "--define"},
+    ]
+    assert [o.number for o in options[1:3]] == [2, 1]
+
+
+@pytest.mark.parametrize(
+    "call", ("take_flag(5)", "take_args(2.5, 1)", "take_all(None)")
+)
+def test_declarations_skips_names_that_arent_names(call):
+    source = f"{call}\ntake_flag('v')"
+    assert [o.names for o in completion.declarations(source)] == [{"-v"}]
+
+
+def test_spec_round_trips():
+    options = completion.declarations(SCRIPT)
+    described = completion.spec(options)
+    assert json.loads(json.dumps(described)) == described
+    assert completion.spec(completion.from_spec(described)) == described
+
+
+def test_scan_uses_cached_spec_if_script_is_unchanged(script, monkeypatch):
+    first = completion.scan(str(script))
+
+    def fail(_):
+        raise AssertionError("Scanned again")
+
+    monkeypatch.setattr(completion, "declarations", fail)
+    assert completion.spec(completion.scan(str(script))) == completion.spec(first)
+
+
+def test_scan_again_if_script_changed(script):
+    completion.scan(str(script))
+    script.write_text("import lethargy\nlethargy.take_flag('x')\n")
+    assert completion.spec(completion.scan(str(script)))[0]["names"] == ["-x"]
+
+
+def test_bash_lists_every_name():
+    text = completion.bash("my-tool", completion.declarations(SCRIPT))
+    assert "-v --verbose --set-hours -o --output --ignore -D --define" in text
+    assert text.endswith("complete -o default -F _lethargy_my_tool my-tool\n")
+
+
+def test_zsh_describes_arguments():
+    text = completion.zsh("tool", completion.declarations(SCRIPT))
+    assert text.startswith("#compdef tool\n_arguments")
+    assert "'--verbose'" in text
+    assert "'--set-hours:value:_files:value:_files'" in text
+    assert "'--ignore:*:value:_files'" in text
+    assert "'*--define:key=value: '" in text
+
+
+def test_fish_has_a_line_per_option():
+    lines = completion.fish("tool", completion.declarations(SCRIPT)).splitlines()
+    assert lines == [
+        "complete -c tool -s v -l verbose",
+        "complete -c tool -l set-hours -r",
+        "complete -c tool -s o -l output -r",
+        "complete -c tool -l ignore -r",
+        "complete -c tool -s D -l define -r",
+    ]
+
+
+def test_main_prints_script(script, capsys):
+    completion.main(["completion", "fish", str(script), "--prog", "tool"])
+    out, _ = capsys.readouterr()
+    assert out.startswith("complete -c tool -s v -l verbose\n")
+
+
+def test_main_fails_with_usage(capsys):
+    with pytest.raises(SystemExit):
+        completion.main(["completion", "tcsh", "script.py"])
+    _, err = capsys.readouterr()
+    assert err.startswith("Usage:")
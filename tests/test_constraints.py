@@ -0,0 +1,91 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import pytest
+
+from lethargy import take_args, take_flag, collecting
+from lethargy.constraints import Constraints
+from lethargy.errors import (
+    ConflictingOptions,
+    MissingDependency,
+    MissingOption,
+    OptionErrors,
+)
+from lethargy.util import trackers
+
+x = str.split
+
+
+@pytest.fixture
+def rules():
+    rules = Constraints()
+    rules.exclusive("json", "csv", ["t", "table"])
+    rules.requires("output", "format")
+    rules.any_of("input", "stdin")
+    return rules
+
+
+def parse(rules, args):
+    args = x(args)
+    with rules:
+        for name in ("json", "csv", ["t", "table"], "stdin"):
+            take_flag(name, args=args)
+        for name in ("output", "format", "input"):
+            take_args(name, 1, args=args)
+    return args
+
+
+def test_valid_options_pass(rules):
+    assert parse(rules, "s --stdin --json --output o --format f") == ["s"]
+
+
+def test_tracking_stops_after_the_block(rules):
+    parse(rules, "s --stdin")
+    assert trackers == []
+
+
+def test_exclusive_options_conflict(rules):
+    with pytest.raises(ConflictingOptions) as info:
+        parse(rules, "s --stdin --json -t")
+    assert str(info.value) == "Options can't be used together: '--json', '-t|--table'"
+
+
+def test_dependency_must_be_present(rules):
+    with pytest.raises(MissingDependency) as info:
+        parse(rules, "s --stdin --output o")
+    assert str(info.value) == "Option '--output' requires '--format'"
+
+
+def test_at_least_one_must_be_present(rules):
+    with pytest.raises(MissingOption) as info:
+        parse(rules, "s --json")
+    assert str(info.value) == "Expected at least one of '--input', '--stdin'"
+
+
+def test_every_broken_rule_is_collected(rules):
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            parse(rules, "s --csv --json --output o")
+    kinds = [type(error) for error in info.value.exceptions]
+    assert kinds == [ConflictingOptions, MissingDependency, MissingOption]
+
+
+def test_rules_are_not_checked_if_the_block_raises(rules):
+    with pytest.raises(KeyError):
+        with rules:
+            raise KeyError
+
+
+def test_names_of_the_same_option_share_a_bit():
+    rules = Constraints()
+    assert rules.bit(["t", "table"]) == rules.bit("table") == rules.bit("t")
+    assert rules.bit("json") != rules.bit("t")
+
+
+def test_present_is_reset_when_entering(rules):
+    parse(rules, "s --stdin --json")
+    parse(rules, "s --stdin --csv")
+    assert rules.check() == []
@@ -0,0 +1,137 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+from lethargy import defaults, take_args, ArgsError, MissingOption, TransformError
+from lethargy import collecting, OptionErrors
+from lethargy.defaults import config, environ
+
+x = str.split
+
+ENV = {"APP_THREADS": "4", "APP_SET_HOURS": "8AM 4PM", "OTHER_THREADS": "1"}
+
+
+@pytest.mark.parametrize("prefix", ("APP", "app", "APP_"))
+def test_environ_only_keeps_prefixed_variables(prefix):
+    assert environ(prefix, ENV) == {"threads": "4", "set_hours": "8AM 4PM"}
+
+
+def test_take_args_falls_back_to_environment():
+    env = environ("APP", ENV)
+    assert take_args("threads", 1, int, args=[], defaults=env) == 4
+    assert take_args("set hours", 2, args=[], defaults=env) == ["8AM", "4PM"]
+
+
+def test_take_args_prefers_given_arguments():
+    args = x("--threads 2")
+    assert take_args("threads", 1, int, args=args, defaults=environ("APP", ENV)) == 2
+    assert args == []
+
+
+def test_environment_satisfies_required():
+    env = environ("APP", ENV)
+    assert take_args("threads", 1, args=[], required=True, defaults=env) == "4"
+    with pytest.raises(MissingOption):
+        take_args("missing", 1, args=[], required=True, defaults=env)
+
+
+def test_environment_value_is_transformed():
+    env = environ("APP", {"APP_THREADS": "many"})
+    with pytest.raises(TransformError):
+        take_args("threads", 1, int, args=[], defaults=env)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "lethargy"
+
+
+def test_take_args_accepts_non_string_default():
+    assert take_args("threads", 1, int, args=[], defaults={"threads": 4}) == 4
+    with pytest.raises(ArgsError):
+        take_args("pair", 2, int, args=[], defaults={"pair": 4})
+
+
+def test_config_reads_ini_section(tmp_path, cache):
+    path = tmp_path / "tool.ini"
+    path.write_text("[tool]\nthreads = 4\nset-hours = 8AM 4PM\n")
+    values = config(str(path), "tool")
+    assert values == {"threads": "4", "set_hours": "8AM 4PM"}
+    assert take_args("set hours", 2, args=[], defaults=values) == ["8AM", "4PM"]
+
+
+def test_config_reads_ini_defaults_without_section(tmp_path, cache):
+    path = tmp_path / "tool.cfg"
+    path.write_text("[DEFAULT]\nthreads = 4\n")
+    assert config(str(path)) == {"threads": "4"}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib is 3.11+")
+def test_config_reads_toml_table(tmp_path, cache):
+    path = tmp_path / "tool.toml"
+    path.write_text('[tool.opts]\nthreads = 4\nhosts = ["a", "b"]\n[tool.opts.x]\n')
+    values = config(str(path), "tool.opts")
+    assert values == {"threads": "4", "hosts": ["a", "b"]}
+    assert take_args("hosts", 2, args=[], defaults=values) == ["a", "b"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib is 3.11+")
+@pytest.mark.parametrize("section", ("tool.missing", "name", "name.x"))
+def test_config_rejects_toml_section_that_isnt_a_table(tmp_path, cache, section):
+    path = tmp_path / "tool.toml"
+    path.write_text('name = "x"\n[tool]\nthreads = 4\n')
+    with pytest.raises(ValueError, match=section):
+        config(str(path), section)
+
+
+def test_config_rejects_missing_ini_section(tmp_path, cache):
+    path = tmp_path / "tool.ini"
+    path.write_text("[tool]\nthreads = 4\n")
+    with pytest.raises(ValueError, match="tool2"):
+        config(str(path), "tool2")
+
+
+def test_config_skips_parsing_if_file_is_unchanged(tmp_path, cache, monkeypatch):
+    path = tmp_path / "tool.ini"
+    path.write_text("[DEFAULT]\nthreads = 4\n")
+    assert config(str(path)) == {"threads": "4"}
+    assert list(cache.iterdir())
+
+    def fail(*_):
+        raise AssertionError("Parsed again")
+
+    monkeypatch.setattr(defaults, "read_config", fail)
+    assert config(str(path)) == {"threads": "4"}
+
+
+def test_config_parses_again_if_file_changed(tmp_path, cache):
+    path = tmp_path / "tool.ini"
+    path.write_text("[DEFAULT]\nthreads = 4\n")
+    assert config(str(path)) == {"threads": "4"}
+    path.write_text("[DEFAULT]\nthreads = 16\n")
+    assert config(str(path)) == {"threads": "16"}
+
+
+def test_config_without_cache_writes_nothing(tmp_path, cache):
+    path = tmp_path / "tool.ini"
+    path.write_text("[DEFAULT]\nthreads = 4\n")
+    assert config(str(path), cache=False) == {"threads": "4"}
+    assert not cache.exists()
+
+
+def test_invalid_default_is_deferred_while_collecting():
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            threads = take_args("threads", 1, int, args=[], defaults={"threads": "x"})
+            a, b = take_args("pair", 2, args=[], defaults={"pair": "a b c"})
+    assert (threads, a, b) == (None, None, None)
+    kinds = [type(e) for e in info.value.exceptions]
+    assert issubclass(kinds[0], TransformError)
+    assert kinds[1] is ArgsError
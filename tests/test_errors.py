@@ -0,0 +1,51 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+from lethargy.errors import (
+    ArgsError,
+    MissingOption,
+    OptionError,
+    OptionErrors,
+    TransformError,
+)
+
+
+def test_optionerrors_is_an_optionerror():
+    assert isinstance(OptionErrors("m", [ArgsError()]), OptionError)
+
+
+def test_optionerrors_str_is_every_message_on_its_own_line():
+    group = OptionErrors("m", [ArgsError("a"), MissingOption("b")])
+    assert str(group) == "a\nb"
+
+
+def test_optionerrors_keeps_message_and_exceptions():
+    errors = [ArgsError("a"), MissingOption("b")]
+    group = OptionErrors("m", errors)
+    assert group.message == "m"
+    assert group.exceptions == tuple(errors)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="ExceptionGroup is 3.11+")
+def test_optionerrors_is_an_exceptiongroup():
+    group = OptionErrors("m", [ArgsError("a"), MissingOption("b")])
+    assert isinstance(group, ExceptionGroup)  # pylint: disable=undefined-variable
+    missing, rest = group.split(MissingOption)
+    assert isinstance(missing, OptionErrors)
+    assert str(missing) == "b"
+    assert str(rest) == "a"
+
+
+def test_transformerror_of_reuses_subclasses():
+    first = TransformError.of(ValueError())
+    assert first is TransformError.of(ValueError("Another"))
+    assert issubclass(first, TransformError)
+    assert issubclass(first, ValueError)
+    assert first.__name__ == "TransformError[ValueError]"
@@ -0,0 +1,110 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import random
+
+import pytest
+
+from lethargy.errors import OptionErrors
+from lethargy.incremental import Incremental
+from lethargy.options import Explicit, Flag, Variadic, take
+from lethargy.util import collecting, identity
+
+x = str.split
+
+calls = []
+
+
+def counted(value):
+    calls.append(value)
+    return int(value)
+
+
+def options():
+    return [
+        Flag({"-v"}),
+        Explicit({"-n"}, 1, counted, False),
+        Explicit({"-p"}, 2, identity, True),
+        Flag({"-q"}),
+        Variadic({"-a"}, counted),
+    ]
+
+
+def reference(args):
+    """Take every option from scratch, like the `take_*` calls would."""
+    args = list(args)
+    values, errors = [], []
+    try:
+        with collecting():
+            values = [take(option, args) for option in options()]
+    except OptionErrors as group:
+        errors = list(group.exceptions)
+    return tuple(values), args, [str(e) for e in errors]
+
+
+def outcome(incremental, values):
+    return values, incremental.remaining, [str(e) for e in incremental.errors]
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def test_parse_matches_take():
+    incremental = Incremental(options())
+    args = x("s -v -n 1 -p a b rest -a 1 2")
+    assert outcome(incremental, incremental.parse(args)) == reference(args)
+
+
+def test_edit_matches_take():
+    incremental = Incremental(options())
+    incremental.parse(x("s -p a b -n 1"))
+    values = incremental.edit(1, 0, ["-v"])
+    assert outcome(incremental, values) == reference(x("s -v -p a b -n 1"))
+
+
+def test_appending_values_reuses_transformed_values():
+    incremental = Incremental(options())
+    args = x("s -p a b -a")
+    incremental.parse(args)
+    for value in ("1", "2", "3"):
+        args.append(value)
+        values = incremental.edit(len(args) - 1, 0, [value])
+    assert calls == ["1", "2", "3"]
+    assert outcome(incremental, values) == reference(args)
+
+
+def test_edit_after_an_option_does_not_search_again():
+    incremental = Incremental(options())
+    incremental.parse(x("s -n 5 -p a b"))
+    before = incremental.states[1]
+    incremental.edit(5, 0, ["more"])
+    assert incremental.states[1] is before
+
+
+def test_errors_are_collected():
+    incremental = Incremental(options())
+    values = incremental.parse(x("s -n x -p a"))
+    assert outcome(incremental, values) == reference(x("s -n x -p a"))
+    assert len(incremental.errors) == 2
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_edits_match_take(seed):
+    rng = random.Random(seed)
+    words = ["-v", "-n", "-p", "-q", "-a", "1", "2", "x", "y"]
+    args = ["s"] + [rng.choice(words) for _ in range(rng.randint(0, 8))]
+    incremental = Incremental(options())
+    assert outcome(incremental, incremental.parse(args)) == reference(args)
+
+    for _ in range(20):
+        index = rng.randint(1, len(args))
+        removed = rng.randint(0, min(2, len(args) - index))
+        inserted = [rng.choice(words) for _ in range(rng.randint(0, 2))]
+        args[index : index + removed] = inserted
+        values = incremental.edit(index, removed, inserted)
+        assert outcome(incremental, values) == reference(args)
@@ -0,0 +1,147 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from lethargy import __main__ as entry
+from lethargy.options import Explicit, Flag, Variadic
+
+x = str.split
+
+SPECS = ["v|verbose", "o|output:1", "size:2", "dry run", "include:*"]
+
+
+@pytest.mark.parametrize(
+    "spec, kind, names, number",
+    (
+        ("v|verbose", Flag, {"-v", "--verbose"}, None),
+        ("o|output:1", Explicit, {"-o", "--output"}, 1),
+        ("size:2", Explicit, {"--size"}, 2),
+        ("include:*", Variadic, {"--include"}, None),
+    ),
+)
+def test_option_from(spec, kind, names, number):
+    option = entry.option_from(spec)
+    assert type(option) is kind
+    assert option.names == names
+    assert getattr(option, "number", None) == number
+
+
+@pytest.mark.parametrize("spec", ("x:0", "x:-1", "x:y", "1:1", "c.d", "|"))
+def test_option_from_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        entry.option_from(spec)
+
+
+@pytest.mark.parametrize("specs", (["v|verbose", "verbose:1"], ["dry-run", "dry_run"]))
+def test_options_from_rejects_duplicate_variables(specs):
+    with pytest.raises(ValueError):
+        entry.options_from(specs)
+
+
+def test_main_fails_for_duplicate_variables(capsys):
+    with pytest.raises(SystemExit):
+        entry.main(["lethargy", "v|verbose", "verbose:1", "--"])
+    _, err = capsys.readouterr()
+    assert err == "More than one option would be assigned to 'verbose'\n"
+
+
+def test_variable_uses_longest_name():
+    assert entry.variable({"-n", "--dry-run"}) == "dry_run"
+
+
+def test_parse():
+    options = [entry.option_from(spec) for spec in SPECS]
+    args = x("a -v --output out b --include c d")
+    assert entry.parse(options, args) == {
+        "verbose": True,
+        "output": "out",
+        "size": None,
+        "dry_run": False,
+        "include": ["c", "d"],
+    }
+    assert args == x("a b")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        (True, "1"),
+        (False, "''"),
+        (None, "''"),
+        ([], "''"),
+        ("a b", "'a b'"),
+        (["a", "b c"], "'a '\"'\"'b c'\"'\"''"),
+    ),
+)
+def test_shell_value(value, expected):
+    assert entry.shell_value(value) == expected
+
+
+def test_main_prints_assignments(capsys):
+    entry.main(["lethargy", *SPECS, "--", *x("a -v --size 1 2 b")])
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        "verbose=1",
+        "output=''",
+        "size='1 2'",
+        "dry_run=''",
+        "include=''",
+        "set -- a b",
+    ]
+
+
+def test_main_prints_json(capsys):
+    entry.main(["lethargy", "--json", *SPECS, "--", *x("a -o out")])
+    out, _ = capsys.readouterr()
+    assert json.loads(out) == {
+        "options": {
+            "verbose": False,
+            "output": "out",
+            "size": None,
+            "dry_run": False,
+            "include": [],
+        },
+        "args": ["a"],
+    }
+
+
+def test_main_shows_every_error(capsys):
+    with pytest.raises(SystemExit):
+        entry.main(["lethargy", "--strict", *SPECS, "--", *x("--verbsoe --size 1")])
+    _, err = capsys.readouterr()
+    assert err.splitlines() == [
+        "Expected 2 arguments for option '--size <value> <value>', but found 1 ('1')",
+        "Unknown option '--verbsoe' (did you mean '--verbose'?)",
+    ]
+
+
+def test_main_fails_with_usage(capsys):
+    with pytest.raises(SystemExit):
+        entry.main(["lethargy", "v|verbose"])
+    _, err = capsys.readouterr()
+    assert err.startswith("Usage:")
+
+
+def test_eval_in_shell():
+    script = (
+        'opts=$("$PYTHON" -m lethargy "o|output:1" "i|include:*" -- "$@") || exit\n'
+        'eval "$opts"\n'
+        'printf "<%s>" "$output" "$@"\n'
+        'eval "set -- $include"\n'
+        'printf "[%s]" "$@"\n'
+    )
+    args = ["a", "-o", "x y", "b", "-i", "it's", "$HOME"]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(entry.__file__)))
+    env = dict(os.environ, PYTHON=sys.executable, PYTHONPATH=root)
+    command = ["sh", "-c", script, "sh", *args]
+    result = subprocess.run(command, env=env, stdout=subprocess.PIPE, check=True)
+    assert result.stdout.decode() == "<x y><a><b>[it's][$HOME]"
@@ -0,0 +1,161 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from lethargy.errors import MissingOption
+from lethargy.options import Explicit, Flag, Pattern, Variadic
+from lethargy.plans import Plan, dump, load, refer, register, registry, resolve
+from lethargy.transformers import choices, int_array
+from lethargy.util import identity
+
+x = str.split
+
+mode = register(choices("fast", "slow"), "mode")
+
+OPTIONS = [
+    Flag({"-v", "--verbose"}),
+    Explicit({"-n", "--number"}, 1, int, True),
+    Explicit({"--mode"}, 1, mode, False),
+    Explicit({"--name"}, 2, identity, False),
+    Variadic({"--ids"}, int_array),
+]
+
+
+worker = {}
+
+
+def start_worker(plan):
+    worker["plan"] = plan
+
+
+def parse_in_worker(args):
+    return worker["plan"].parse(x(args))
+
+
+def test_identity_is_importable():
+    assert refer(identity) == "lethargy.util:identity"
+    assert pickle.loads(pickle.dumps(identity)) is identity
+
+
+@pytest.mark.parametrize(
+    "transformer, ref",
+    ((int, "builtins:int"), (int_array, "lethargy.transformers:int_array")),
+)
+def test_refer_and_resolve(transformer, ref):
+    assert refer(transformer) == ref
+    assert resolve(ref) is transformer
+
+
+def test_registered_transformers_are_referred_to_by_name():
+    assert refer(mode) == "mode"
+    assert resolve("mode") is mode
+
+
+def test_register_is_a_decorator():
+    @register
+    def shout(value):
+        return value.upper()
+
+    try:
+        assert refer(shout) == "shout"
+    finally:
+        del registry["shout"]
+
+
+def test_register_rejects_bad_names():
+    with pytest.raises(ValueError):
+        register(int, "a:b")
+    # Instances don't have a `__name__` to fall back on.
+    with pytest.raises(ValueError):
+        register(choices("a"))
+    assert "int" not in registry
+
+
+def test_unregistered_lambda_cannot_be_described():
+    with pytest.raises(ValueError):
+        dump([Explicit({"-x"}, 1, lambda v: v, False)])
+
+
+@pytest.mark.parametrize("ref", ("nothing", "lethargy.util:nothing"))
+def test_resolve_unknown_reference(ref):
+    with pytest.raises(ValueError):
+        resolve(ref)
+
+
+def test_dump_is_json_compatible():
+    described = dump(OPTIONS)
+    assert json.loads(json.dumps(described)) == described
+    assert described[1] == {
+        "kind": "args",
+        "names": ["--number", "-n"],
+        "number": 1,
+        "transform": "builtins:int",
+        "required": True,
+    }
+
+
+def test_dump_rejects_defaults():
+    with pytest.raises(ValueError):
+        dump([Explicit({"-x"}, 1, identity, False, {"x": "1"})])
+
+
+def test_dump_rejects_other_options():
+    with pytest.raises(TypeError):
+        dump([Pattern({"-D"}, identity)])
+
+
+def test_load_gives_the_same_options():
+    plan = load(dump(OPTIONS))
+    assert [str(option) for option in plan.options] == list(map(str, OPTIONS))
+    assert plan.options[1].required is True
+    assert plan.options[2].transformer is mode
+
+
+def test_parse():
+    args = x("a -v -n 3 --mode slow b --ids 1 2")
+    values = Plan(OPTIONS).parse(args)
+    assert values[:4] == (True, 3, "slow", [None, None])
+    assert list(values[4]) == [1, 2]
+    assert args == x("a b")
+
+
+def test_parse_raises_like_take():
+    with pytest.raises(MissingOption):
+        Plan(OPTIONS).parse(x("a"))
+
+
+def test_pickles_as_its_description():
+    plan = Plan(OPTIONS)
+    again = pickle.loads(pickle.dumps(plan))
+    assert again.described == plan.described
+    assert again.parse(x("-n 1")) == plan.parse(x("-n 1"))
+
+
+def test_parse_in_process_pool():
+    plan = Plan(OPTIONS)
+    commands = ["-n 1 -v", "--mode fast -n 2", "-n 3 --ids 4 5"]
+    pool = ProcessPoolExecutor(2, initializer=start_worker, initargs=(plan,))
+    with pool:
+        results = list(pool.map(parse_in_worker, commands))
+    assert [result[:3] for result in results] == [
+        (True, 1, None),
+        (False, 2, "fast"),
+        (False, 3, None),
+    ]
+
+
+def test_registered_lambdas_can_be_pickled():
+    shout = register(lambda value: value.upper(), "shout")
+    try:
+        plan = pickle.loads(pickle.dumps(Plan([Explicit({"-x"}, 1, shout, False)])))
+        assert plan.parse(x("-x hi")) == ("HI",)
+    finally:
+        del registry["shout"]
@@ -0,0 +1,197 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from lethargy import server
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Needs Unix domain sockets"
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(server.__file__)))
+ENV = dict(os.environ, PYTHONPATH=ROOT)
+
+SCRIPT = """
+import lethargy
+with lethargy.show_errors():
+    n = lethargy.take_args('n', 1, int, required=True)
+print(n * 2, lethargy.argv)
+if lethargy.take_flag('bytes', args=lethargy.argvb):
+    print(lethargy.argvb)
+"""
+
+
+def start_server(tmp_path, source):
+    script = tmp_path / "script.py"
+    script.write_text(source)
+    path = str(tmp_path / "server.sock")
+
+    command = [sys.executable, "-m", "lethargy.server", "serve", str(script)]
+    process = subprocess.Popen(command + ["--socket", path], env=ENV)
+
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        time.sleep(0.05)
+
+    return process, path
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    process, path = start_server(tmp_path, SCRIPT)
+    yield path
+    process.kill()
+    process.wait()
+
+
+def run(path, args, tmp_path):
+    out, err = tmp_path / "out", tmp_path / "err"
+    with open(os.devnull) as i, open(out, "w") as o, open(err, "w") as e:
+        status = server.run(path, args, fds=(i.fileno(), o.fileno(), e.fileno()))
+    return status, out.read_text(), err.read_text()
+
+
+def test_run_uses_client_argv(socket_path, tmp_path):
+    status, out, err = run(socket_path, ["script.py", "-n", "21", "x"], tmp_path)
+    assert (status, out, err) == (0, "42 ['script.py', 'x']\n", "")
+
+
+def test_run_reports_errors_like_a_normal_run(socket_path, tmp_path):
+    status, out, err = run(socket_path, ["script.py", "-n", "x"], tmp_path)
+    assert (status, out) == (1, "")
+    assert err == "Option '-n <int>' received an invalid value: 'x'\n"
+
+
+def test_each_run_starts_from_a_fresh_fork(socket_path, tmp_path):
+    assert run(socket_path, ["script.py", "-n", "1"], tmp_path)[0] == 0
+    assert run(socket_path, ["script.py"], tmp_path)[0] == 1
+    _, out, _ = run(socket_path, ["script.py", "-n", "2"], tmp_path)
+    assert out == "4 ['script.py']\n"
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("pass", 0),
+        ("raise SystemExit(3)", 3),
+        ("raise SystemExit('no')", 1),
+        ("1/0", 1),
+    ],
+)
+def test_execute_gets_exit_code(source, expected, capsys):
+    assert server.execute(compile(source, "<test>", "exec"), "<test>") == expected
+    capsys.readouterr()
+
+
+def test_default_socket_is_in_a_directory_for_the_user(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = server.default_socket("/x/script.py")
+    assert path == str(tmp_path / f"lethargy-{os.getuid()}" / "script.py.sock")
+
+
+def test_run_refuses_a_path_that_isnt_a_socket(tmp_path):
+    path = tmp_path / "fake.sock"
+    path.write_text("")
+    with pytest.raises(PermissionError):
+        server.run(str(path), ["script.py"])
+
+
+def test_server_socket_is_private(socket_path):
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_peer_uid_is_this_user():
+    if not hasattr(socket, "SO_PEERCRED"):
+        pytest.skip("Needs SO_PEERCRED")
+    a, b = socket.socketpair()
+    with a, b:
+        assert server.peer_uid(a) == os.getuid()
+        server.check_peer(a)
+
+
+def test_child_exits_when_handling_fails(tmp_path):
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    a, b = socket.socketpair()
+    b.close()
+    pid = os.fork()
+    if pid == 0:
+        # The client is gone, so `handle` raises and `child` must still exit.
+        with open(os.devnull, "w") as null:
+            os.dup2(null.fileno(), 2)
+        server.child(listener, a, "<test>", compile("pass", "<test>", "exec"))
+    listener.close()
+    a.close()
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 1
+
+
+def test_client_does_not_import_lethargy_or_enum(tmp_path):
+    env = dict(ENV, LETHARGY_SOCKET=str(tmp_path / "none.sock"))
+    command = [sys.executable, "-S", "-X", "importtime", server.__file__, "run", "x"]
+    result = subprocess.run(command, env=env, stderr=subprocess.PIPE)
+    lines = result.stderr.decode().splitlines()
+    imported = {line.split("|")[-1].strip() for line in lines if "|" in line}
+    assert result.returncode == 1
+    assert lines[-1] == f"Couldn't connect to a server at '{tmp_path / 'none.sock'}'"
+    assert not imported & {"enum", "json", "socket", "signal", "lethargy"}
+
+
+def test_run_forwards_signals_to_the_script(tmp_path):
+    source = "import time\nprint('started', flush=True)\ntime.sleep(30)\n"
+    process, path = start_server(tmp_path, source)
+    try:
+        env = dict(ENV, LETHARGY_SOCKET=path)
+        command = [sys.executable, "-m", "lethargy.server", "run", "script.py"]
+        client = subprocess.Popen(
+            command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        assert client.stdout.readline() == b"started\n"
+        client.send_signal(signal.SIGINT)
+        assert client.wait(timeout=10) == 1
+        assert b"KeyboardInterrupt" in client.stderr.read()
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_launcher_runs_the_script_through_the_server(socket_path, tmp_path):
+    launcher = tmp_path / "launcher"
+    launcher.write_text(server.launcher(str(tmp_path / "script.py"), socket_path))
+    launcher.chmod(0o700)
+    result = subprocess.run(
+        [str(launcher), "-n", "4"], env=ENV, stdout=subprocess.PIPE, check=True
+    )
+    assert result.stdout == f"8 ['{tmp_path / 'script.py'}']\n".encode()
+
+
+def test_main_prints_a_launcher(capsys):
+    server.main(["server.py", "client", "script.py", "--socket", "/tmp/a b.sock"])
+    out, _ = capsys.readouterr()
+    assert out.startswith("#!/bin/sh\nLETHARGY_SOCKET='/tmp/a b.sock' exec ")
+    assert out.endswith(" run " + os.path.abspath("script.py") + ' "$@"\n')
+
+
+def test_main_fails_with_usage(capsys):
+    with pytest.raises(SystemExit):
+        server.main(["server.py", "stop", "script.py"])
+    _, err = capsys.readouterr()
+    assert err.startswith("Usage:")
+
+
+def test_run_replaces_argvb(socket_path, tmp_path):
+    args = ["script.py", "-n", "1", "--bytes", "x\udcff"]
+    status, out, err = run(socket_path, args, tmp_path)
+    assert (status, err) == (0, "")
+    assert out.splitlines()[-1] == "[b'script.py', b'-n', b'1', b'x\\xff']"
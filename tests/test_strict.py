@@ -0,0 +1,141 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import pytest
+
+from lethargy import collecting, take_args, take_flag, take_pairs
+from lethargy.errors import OptionErrors, UnknownOption
+from lethargy.strict import (
+    BKTree,
+    distance,
+    looks_like_option,
+    reject_unknown,
+    unknown_options,
+)
+from lethargy.util import known, names_from
+
+x = str.split
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    (
+        ("", "", 0),
+        ("abc", "", 3),
+        ("--verbose", "--verbose", 0),
+        ("--verbsoe", "--verbose", 2),
+        ("--outptu", "--output", 2),
+        ("kitten", "sitting", 3),
+    ),
+)
+def test_distance(a, b, expected):
+    assert distance(a, b) == expected
+    assert distance(b, a) == expected
+
+
+def test_bk_tree_search_matches_brute_force():
+    words = [f"--{a}{b}{c}" for a in "abcd" for b in "efgh" for c in "ijkl"]
+    tree = BKTree(words)
+    for query in ("--aei", "--zzz", "--bfj", "--aexl", "-a"):
+        for tolerance in (0, 1, 2):
+            distances = sorted((distance(query, w), w) for w in words)
+            expected = [(d, w) for d, w in distances if d <= tolerance]
+            assert tree.search(query, tolerance) == expected
+
+
+def test_bk_tree_ignores_duplicates():
+    tree = BKTree(["--a", "--a", "--b"])
+    assert tree.search("--a", 0) == [(0, "--a")]
+
+
+def test_empty_bk_tree():
+    assert BKTree().search("--a", 5) == []
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    (
+        ("-v", True),
+        ("--verbose", True),
+        ("--dry-run", True),
+        ("-", False),
+        ("--", False),
+        ("value", False),
+        ("-5", False),
+        ("-0.25", False),
+        ("-1e3", False),
+    ),
+)
+def test_looks_like_option(token, expected):
+    assert looks_like_option(token) is expected
+
+
+def test_unknown_options_suggests_closest_name():
+    errors = unknown_options(x("a --verbsoe b"), {"--verbose", "--version", "-v"})
+    message = "Unknown option '--verbsoe' (did you mean '--verbose'?)"
+    assert [str(e) for e in errors] == [message]
+
+
+def test_unknown_options_without_a_close_name():
+    errors = unknown_options(x("--zzzzzzzz"), {"--verbose"})
+    assert [str(e) for e in errors] == ["Unknown option '--zzzzzzzz'"]
+
+
+def test_unknown_options_bytes():
+    errors = unknown_options([b"--outptu"], {"--output"})
+    message = "Unknown option '--outptu' (did you mean '--output'?)"
+    assert [str(e) for e in errors] == [message]
+
+
+def test_taking_options_records_known_names():
+    args = x("--strict-test-name")
+    take_flag("strict-test-name", args=args)
+    take_pairs("strict-test-pair", args=args)
+    assert {"--strict-test-name", "--strict-test-pair"} <= known
+
+
+def test_names_from_alone_does_not_record_names():
+    names_from("strict-test-unused")
+    assert "--strict-test-unused" not in known
+
+
+def test_unknown_options_stops_at_double_dash():
+    assert unknown_options(x("s -- -rf-file --x"), {"--y"}) == []
+    assert len(unknown_options(x("--x -- --y"), {"--y"})) == 1
+
+
+def test_reject_unknown_raises():
+    args = x("script --color always --verbsoe file")
+    take_args("color", 1, args=args)
+    take_flag("verbose", args=args)
+    with pytest.raises(UnknownOption) as info:
+        reject_unknown(args=args)
+    assert str(info.value) == "Unknown option '--verbsoe' (did you mean '--verbose'?)"
+
+
+def test_reject_unknown_passes():
+    args = x("script --verbose file -1")
+    take_flag("verbose", args=args)
+    reject_unknown(args=args)
+
+
+def test_reject_unknown_collects_every_error():
+    args = x("script --verbsoe --colr")
+    with pytest.raises(OptionErrors) as info:
+        with collecting():
+            take_flag("verbose", args=args)
+            take_flag("color", args=args)
+            reject_unknown(args=args)
+    assert [type(e) for e in info.value.exceptions] == [UnknownOption, UnknownOption]
+
+
+def test_unknown_options_skips_known_names():
+    assert unknown_options(x("--verbose -v"), {"--verbose", "-v"}) == []
+
+
+def test_reject_unknown_with_names():
+    with pytest.raises(UnknownOption, match="did you mean '--only'"):
+        reject_unknown(args=x("--onyl"), names={"--only"})
@@ -0,0 +1,175 @@
+# Keep on separate lines for better diff and readability ~
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+from array import array
+
+import pytest
+
+from lethargy import take_all, take_args, TransformError
+from lethargy.transformers import (
+    Packed,
+    byte_string,
+    choices,
+    float_array,
+    int_array,
+    memoize,
+)
+
+x = str.split
+
+
+def test_packed_all_converts_into_container():
+    packed = Packed("thing", tuple, int)
+    assert packed.all(["1", "2"]) == (1, 2)
+
+
+def test_packed_call_converts_a_single_value():
+    assert int_array("5") == 5
+    assert byte_string("255") == 255
+
+
+@pytest.mark.parametrize(
+    "transformer, expected",
+    [
+        (int_array, array("q", [1, 2, 3])),
+        (float_array, array("d", [1.0, 2.0, 3.0])),
+        (byte_string, b"\x01\x02\x03"),
+    ],
+)
+def test_take_all_packs_values(transformer, expected):
+    args = x("# -x 1 2 3")
+    assert take_all("x", transformer, args=args) == expected
+    assert args == x("#")
+
+
+def test_take_args_packs_values():
+    assert take_args("x", 2, int_array, args=x("-x 1 2")) == array("q", [1, 2])
+    assert take_args("x", 1, byte_string, args=x("-x 5")) == 5
+
+
+def test_metavar_comes_from_the_transformer():
+    with pytest.raises(TransformError, match=r"'-x \[int\]\.\.\.'"):
+        take_all("x", int_array, args=x("-x a"))
+
+
+@pytest.mark.parametrize("transformer", (int_array, float_array, byte_string))
+def test_invalid_value_is_named_in_error(transformer):
+    with pytest.raises(ValueError, match="'bad'"):
+        take_all("x", transformer, args=x("-x 1 bad 3"))
+
+
+@pytest.mark.parametrize(
+    "transformer, value",
+    ((byte_string, "256"), (int_array, "99999999999999999999999")),
+)
+def test_out_of_range_value_is_named_in_error(transformer, value):
+    with pytest.raises(TransformError, match=f"'{value}'") as info:
+        take_all("x", transformer, args=x(f"-x 1 {value}"))
+    assert isinstance(info.value, ValueError)
+    assert not isinstance(info.value, OverflowError)
+
+
+def counter(transformer):
+    calls = []
+
+    def counted(value):
+        calls.append(value)
+        return transformer(value)
+
+    return counted, calls
+
+
+def test_memoize_calls_transformer_once_per_value():
+    counted, calls = counter(int)
+    memoized = memoize(counted)
+    assert take_all("x", memoized, args=x("-x 1 2 1 1 2")) == [1, 2, 1, 1, 2]
+    assert take_args("y", 2, memoized, args=x("-y 2 3")) == [2, 3]
+    assert calls == ["1", "2", "3"]
+
+
+def test_memoize_remembers_errors():
+    counted, calls = counter(int)
+    memoized = memoize(counted)
+    for _ in range(3):
+        with pytest.raises(TransformError, match="'bad'"):
+            take_all("x", memoized, args=x("-x bad"))
+    assert calls == ["bad"]
+
+
+def test_memoize_forgets_least_recently_used():
+    counted, calls = counter(int)
+    memoized = memoize(counted, maxsize=2)
+    for value in ("1", "2", "1", "3", "1", "2"):
+        memoized(value)
+    assert calls == ["1", "2", "3", "2"]
+
+
+def test_memoize_calls_transformer_for_unhashable_values():
+    counted, calls = counter(tuple)
+    memoized = memoize(counted)
+    assert memoized(["a"]) == ("a",)
+    assert memoized(["a"]) == ("a",)
+    assert len(calls) == 2
+
+
+def test_memoize_keeps_metavar():
+    with pytest.raises(TransformError, match=r"'-x \[int\]\.\.\.'"):
+        take_all("x", memoize(int), args=x("-x a"))
+    with pytest.raises(TransformError, match=r"'-x \[int\]\.\.\.'"):
+        take_all("x", memoize(int_array), args=x("-x a"))
+    with pytest.raises(TransformError, match=r"'-x \[value\]\.\.\.'"):
+        take_all("x", memoize(lambda v: int(v)), args=x("-x a"))
+
+
+def test_choices_accepts_only_the_given_values():
+    mode = choices("fast", "slow")
+    assert mode("fast") == "fast"
+    with pytest.raises(ValueError, match=r"^Expected one of 'fast', 'slow'$"):
+        mode("FAST")
+
+
+def test_choices_casefold_gives_the_canonical_value():
+    mode = choices("Fast", "slow", casefold=True)
+    assert mode("FAST") == "Fast"
+    assert mode("Slow") == "slow"
+
+
+def test_choices_metavar():
+    assert choices("a", "b", "c").metavar == "a|b|c"
+
+
+def test_choices_error_lists_valid_values():
+    with pytest.raises(TransformError.of(ValueError())) as info:
+        take_args("mode", 1, choices("fast", "slow"), args=x("--mode quick"))
+    message = "Option '--mode <fast|slow>' received an invalid value: 'quick'"
+    assert str(info.value) == message
+    assert str(info.value.__cause__) == "Expected one of 'fast', 'slow'"
+
+
+def test_choices_with_take_all():
+    args = x("# -x a b a")
+    assert take_all("x", choices("a", "b"), args=args) == ["a", "b", "a"]
+
+
+def test_choices_casefold_only_folds_strings():
+    mode = choices("Auto", 1, None, casefold=True)
+    assert mode("AUTO") == "Auto"
+    with pytest.raises(ValueError):
+        mode("1")
+
+
+@pytest.mark.parametrize("casefold", (True, False))
+def test_choices_accepts_bytes(casefold):
+    mode = choices("fast", "slow", casefold=casefold)
+    assert take_args("x", 1, mode, args=[b"-x", b"fast"]) == "fast"
+    with pytest.raises(TransformError.of(ValueError())):
+        take_args("x", 1, mode, args=[b"-x", b"quick"])
+
+
+@pytest.mark.parametrize("value", (5, ["fast"], b"\xff"))
+def test_choices_rejects_other_values_with_value_error(value):
+    with pytest.raises(ValueError, match="^Expected one of 'fast'$"):
+        choices("fast", casefold=True)(value)
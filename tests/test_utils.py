@@ -5,6 +5,7 @@
 # pylint: disable=protected-access
 
 import contextlib
+import os
 import sys
 
 import pytest
@@ -65,7 +66,7 @@ def test_fail_without_message_prints_nothing(capsys):
 @parametrize("current_err", (ValueError, IndexError))
 def test_expect(capsys, current_err):
     with contextlib.suppress(SystemExit):
-        with util.expect(ValueError, IndexError):
+        with util.expecting(ValueError, IndexError):
             raise current_err("Uh oh!")
     _, err = capsys.readouterr()
     assert err == "Uh oh!\n"
@@ -73,7 +74,7 @@ def test_expect(capsys, current_err):
 
 def test_expect_custom_message_overrides_exception_message(capsys):
     with contextlib.suppress(SystemExit):
-        with util.expect(RuntimeError, reason="yikes"):
+        with util.expecting(RuntimeError, reason="yikes"):
             raise RuntimeError("Uh oh!")
     _, err = capsys.readouterr()
     assert err == "yikes\n"
@@ -120,3 +121,68 @@ def test_names_from():
 
     with pytest.raises(ValueError):
         util.names_from([""])
+
+
+def test_collecting_raises_nothing_without_errors():
+    with util.collecting() as errors:
+        pass
+    assert errors == []
+
+
+def test_collecting_raises_all_deferred_errors_together():
+    first, second = util.OptionError("first"), util.TransformError("second")
+    with pytest.raises(util.OptionErrors) as info:
+        with util.collecting():
+            assert util.defer(first)
+            assert util.defer(second)
+    assert info.value.exceptions == (first, second)
+
+
+def test_defer_is_false_outside_collecting():
+    assert util.defer(util.OptionError()) is False
+
+
+def test_show_errors_prints_every_collected_error(capsys):
+    with contextlib.suppress(SystemExit):
+        with util.show_errors(), util.collecting():
+            util.defer(util.OptionError("one"))
+            util.defer(util.OptionError("two"))
+    _, err = capsys.readouterr()
+    assert err == "one\ntwo\n"
+
+
+def test_key_from():
+    assert util.key_from("--dry-run") == "dry_run"
+    assert util.key_from("-X") == "x"
+    assert util.key_from("/f") == "f"
+
+
+def test_argvb_is_encoded_sys_argv():
+    assert util.argvb == [os.fsencode(arg) for arg in sys.argv]
+
+
+def test_names_from_bytes():
+    assert util.names_from(b"x") == {"-x"}
+    assert util.names_from([b"x", "y"]) == {"-x", "-y"}
+
+
+def test_private_dir_is_only_accessible_by_the_user(tmp_path):
+    path = tmp_path / "private"
+    util.private_dir(str(path))
+    assert path.stat().st_mode & 0o777 == 0o700
+    util.private_dir(str(path))
+
+
+def test_private_dir_rejects_a_shared_directory(tmp_path):
+    path = tmp_path / "shared"
+    path.mkdir(mode=0o777)
+    path.chmod(0o777)
+    with pytest.raises(PermissionError):
+        util.private_dir(str(path))
+
+
+def test_private_dir_rejects_a_symlink(tmp_path):
+    (tmp_path / "real").mkdir(mode=0o700)
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    with pytest.raises(PermissionError):
+        util.private_dir(str(tmp_path / "link"))